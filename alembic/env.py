@@ -9,6 +9,9 @@ from sqlalchemy import pool
 from sqlmodel import SQLModel
 from app.models import ticket as Ticket # type: ignore
 from app.models import ticket_history as TicketHistory # type: ignore
+from app.models import escalation_outbox as EscalationOutbox # type: ignore
+from app.models import escalation_outbox_delivery as EscalationOutboxDelivery # type: ignore
+from app.models import ticket_status_count as TicketStatusCount # type: ignore
 
 from alembic import context
 
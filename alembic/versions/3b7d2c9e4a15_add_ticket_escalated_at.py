@@ -0,0 +1,28 @@
+"""add ticket escalated_at
+
+Revision ID: 3b7d2c9e4a15
+Revises: f16666401f59
+Create Date: 2026-10-18 10:12:40.214507
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7d2c9e4a15'
+down_revision: Union[str, None] = 'f16666401f59'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('ticket', sa.Column('escalated_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('ticket', 'escalated_at')
@@ -0,0 +1,29 @@
+"""add ticket dashboard keyset indexes
+
+Revision ID: 5e9f1d3b7a20
+Revises: 8c41e7a2b6d3
+Create Date: 2026-10-18 14:05:37.916204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e9f1d3b7a20'
+down_revision: Union[str, None] = '8c41e7a2b6d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_ticket_deadline_id', 'ticket', ['resolution_sla_deadline', 'id'], unique=False)
+    op.create_index('ix_ticket_status_deadline_id', 'ticket', ['status', 'resolution_sla_deadline', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_ticket_status_deadline_id', table_name='ticket')
+    op.drop_index('ix_ticket_deadline_id', table_name='ticket')
@@ -0,0 +1,46 @@
+"""create escalation_outbox table
+
+Revision ID: 8c41e7a2b6d3
+Revises: 3b7d2c9e4a15
+Create Date: 2026-10-18 11:40:02.318774
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c41e7a2b6d3'
+down_revision: Union[str, None] = '3b7d2c9e4a15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('escalation_outbox',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('ticket_id', sa.Integer(), nullable=False),
+        sa.Column('event', sa.Enum(name='escalation_level_enum', create_type=False), nullable=False),
+        sa.Column('remaining_percent', sa.Float(), nullable=False),
+        sa.Column('priority', sa.Enum(name='priority_enum', create_type=False), nullable=True),
+        sa.Column('customer_tier', sa.Enum(name='customer_tier_enum', create_type=False), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('delivered_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('last_error', sqlmodel.sql.sqltypes.AutoString(), nullable=True),  # type: ignore
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_escalation_outbox_pending', 'escalation_outbox', ['id'],
+        postgresql_where=sa.text('delivered_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_escalation_outbox_pending', table_name='escalation_outbox')
+    op.drop_table('escalation_outbox')
@@ -0,0 +1,68 @@
+"""track outbox delivery per sink
+
+Revision ID: b4e7d9a1c3f5
+Revises: d2a86c4f19e7
+Create Date: 2026-10-18 16:48:11.204733
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4e7d9a1c3f5'
+down_revision: Union[str, None] = 'd2a86c4f19e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('escalation_outbox_delivery',
+        sa.Column('outbox_id', sa.BigInteger(), nullable=False),
+        sa.Column('sink', sa.String(), nullable=False),
+        sa.Column('delivered_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('next_attempt_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('last_error', sqlmodel.sql.sqltypes.AutoString(), nullable=True),  # type: ignore
+        sa.ForeignKeyConstraint(['outbox_id'], ['escalation_outbox.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('outbox_id', 'sink')
+    )
+    op.create_index(
+        'ix_escalation_outbox_delivery_pending', 'escalation_outbox_delivery', ['sink', 'outbox_id'],
+        postgresql_where=sa.text('delivered_at IS NULL'),
+    )
+    # Events still undelivered at upgrade time stay pending for each of the default sinks
+    op.execute("""
+        INSERT INTO escalation_outbox_delivery (outbox_id, sink, attempts, last_error)
+        SELECT id, s, attempts, last_error FROM escalation_outbox, unnest(ARRAY['slack', 'dashboard']) s
+        WHERE delivered_at IS NULL
+    """)
+    op.drop_index('ix_escalation_outbox_pending', table_name='escalation_outbox')
+    op.drop_column('escalation_outbox', 'last_error')
+    op.drop_column('escalation_outbox', 'attempts')
+    op.drop_column('escalation_outbox', 'delivered_at')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('escalation_outbox', sa.Column('delivered_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('escalation_outbox', sa.Column('attempts', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('escalation_outbox', sa.Column('last_error', sqlmodel.sql.sqltypes.AutoString(), nullable=True))  # type: ignore
+    # Without per-sink state, an event counts as delivered once any sink has it
+    op.execute("""
+        UPDATE escalation_outbox o SET delivered_at = d.delivered_at
+        FROM (
+            SELECT outbox_id, min(delivered_at) AS delivered_at FROM escalation_outbox_delivery GROUP BY outbox_id
+        ) d
+        WHERE d.outbox_id = o.id
+    """)
+    op.create_index(
+        'ix_escalation_outbox_pending', 'escalation_outbox', ['id'],
+        postgresql_where=sa.text('delivered_at IS NULL'),
+    )
+    op.drop_index('ix_escalation_outbox_delivery_pending', table_name='escalation_outbox_delivery')
+    op.drop_table('escalation_outbox_delivery')
@@ -0,0 +1,82 @@
+"""create ticket_status_count table
+
+Revision ID: d2a86c4f19e7
+Revises: 5e9f1d3b7a20
+Create Date: 2026-10-18 15:22:48.530917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a86c4f19e7'
+down_revision: Union[str, None] = '5e9f1d3b7a20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('ticket_status_count',
+        sa.Column('status', sa.Enum(name='ticket_status_enum', create_type=False), nullable=False),
+        sa.Column('count', sa.BigInteger(), server_default='0', nullable=False),
+        sa.PrimaryKeyConstraint('status')
+    )
+    op.execute("""
+        CREATE OR REPLACE FUNCTION ticket_status_count_apply() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                INSERT INTO ticket_status_count (status, count)
+                SELECT status, count(*) FROM new_rows GROUP BY status ORDER BY status
+                ON CONFLICT (status) DO UPDATE SET count = ticket_status_count.count + excluded.count;
+            ELSIF TG_OP = 'DELETE' THEN
+                INSERT INTO ticket_status_count (status, count)
+                SELECT status, -count(*) FROM old_rows GROUP BY status ORDER BY status
+                ON CONFLICT (status) DO UPDATE SET count = ticket_status_count.count + excluded.count;
+            ELSE
+                INSERT INTO ticket_status_count (status, count)
+                SELECT status, sum(delta) FROM (
+                    SELECT o.status, -1 AS delta FROM old_rows o JOIN new_rows n USING (id)
+                    WHERE o.status IS DISTINCT FROM n.status
+                    UNION ALL
+                    SELECT n.status, 1 AS delta FROM old_rows o JOIN new_rows n USING (id)
+                    WHERE o.status IS DISTINCT FROM n.status
+                ) changes
+                GROUP BY status HAVING sum(delta) <> 0 ORDER BY status
+                ON CONFLICT (status) DO UPDATE SET count = ticket_status_count.count + excluded.count;
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER ticket_status_count_insert AFTER INSERT ON ticket
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION ticket_status_count_apply()
+    """)
+    op.execute("""
+        CREATE TRIGGER ticket_status_count_update AFTER UPDATE ON ticket
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION ticket_status_count_apply()
+    """)
+    op.execute("""
+        CREATE TRIGGER ticket_status_count_delete AFTER DELETE ON ticket
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION ticket_status_count_apply()
+    """)
+    op.execute("""
+        INSERT INTO ticket_status_count (status, count)
+        SELECT status, count(*) FROM ticket GROUP BY status
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS ticket_status_count_delete ON ticket")
+    op.execute("DROP TRIGGER IF EXISTS ticket_status_count_update ON ticket")
+    op.execute("DROP TRIGGER IF EXISTS ticket_status_count_insert ON ticket")
+    op.execute("DROP FUNCTION IF EXISTS ticket_status_count_apply()")
+    op.drop_table('ticket_status_count')
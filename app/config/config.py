@@ -6,8 +6,13 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler # type: ignore
 from app.config.sla_config import SLAConfig
 from app.config.sla_config_watcher import start_config_watcher
 from app.config.settings import settings
-from app.db.db import engine
+from app.db.db import async_engine, engine
+from app.services.escalation_timer import escalation_timers
 from app.services.ticket_service import TicketService
+from app.services.sinks.registry import alert_sinks
+from app.services.webhooks.webhook_dispatcher import webhook_dispatcher
+from app.websocket.backbone import alert_backbone
+from app.websocket.manager import manager
 
 import logging
 
@@ -16,6 +21,18 @@ logging.basicConfig(level=logging.INFO)
 scheduler = AsyncIOScheduler()
 
 def schedule_jobs():
+    if settings.ESCALATION_MODE == "timer":
+        # Timers drive escalation; the periodic job only re-reads open deadlines written elsewhere
+        scheduler.add_job( # type: ignore
+            escalation_timers.resync,
+            trigger="interval",
+            seconds=settings.ESCALATION_RESYNC_SECONDS,
+            id="escalation_timer_resync",
+            max_instances=1,
+            coalesce=True,
+        )
+        return
+
     scheduler.add_job( # type: ignore
         TicketService().escalate_workflow,
         trigger="interval",
@@ -28,17 +45,34 @@ def schedule_jobs():
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     SLAConfig.load_config()
-    start_config_watcher()
+    alert_sinks.configure(SLAConfig.sinks())
+    start_config_watcher(TicketService().recompute_sla_deadlines)
 
     SQLModel.metadata.create_all(engine)
 
-    from app.websocket.manager import manager
-    import asyncio
-    manager.set_loop(asyncio.get_event_loop())
+    from app.services.ingestion_queue import ingestion_queue
+    ingestion_queue.start()
+    # Every process relays backbone events to its own sockets, whichever process drained the outbox
+    await alert_backbone.start(manager.broadcast_events)
+    alert_sinks.start()
+
+    if settings.ESCALATION_MODE == "timer":
+        ticket_service = TicketService()
+        escalation_timers.start(
+            escalate=ticket_service.escalate_tickets,
+            load=ticket_service.get_open_ticket_deadlines,
+        )
+        await escalation_timers.resync()
 
     schedule_jobs()
     scheduler.start()
 
     yield
 
-    scheduler.shutdown()
\ No newline at end of file
+    scheduler.shutdown()
+    await escalation_timers.stop()
+    await ingestion_queue.stop()
+    await alert_sinks.stop()
+    await alert_backbone.stop()
+    await webhook_dispatcher.stop()
+    await async_engine.dispose()
\ No newline at end of file
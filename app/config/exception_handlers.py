@@ -1,7 +1,7 @@
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from app.exceptions import handlers
-from app.exceptions.exceptions import NotFoundException, UseCaseException, DBException
+from app.exceptions.exceptions import NotFoundException, QueueFullException, UseCaseException, DBException
 
 
 def register_exception_handlers(app: FastAPI) -> None:
@@ -23,6 +23,12 @@ def register_exception_handlers(app: FastAPI) -> None:
     ) -> JSONResponse:
         return await handlers.not_found_exception_handler(request, exc)
 
+    @app.exception_handler(QueueFullException)
+    async def _queue_full_exception_handler( # type: ignore
+        request: Request, exc: QueueFullException
+    ) -> JSONResponse:
+        return await handlers.queue_full_exception_handler(request, exc)
+
     @app.exception_handler(Exception)
     async def _generic_exception_handler( # type: ignore
         request: Request, exc: Exception
@@ -11,6 +11,38 @@ class Config(BaseSettings):
     SCHEDULER_SECONDS_INTERVAL: int
     SLACK_WEBHOOK_URL: str
     SLA_CONFIG_PATH: str
+    SLA_CONFIG_RELOAD_DEBOUNCE_SECONDS: float = 1.0
+    INGESTION_CHUNK_SIZE: int = 500
+    INGESTION_QUEUE_MAXSIZE: int = 100
+    INGESTION_WORKERS: int = 4
+    INGESTION_JOB_RETENTION: int = 1000
+    TICKET_CACHE_MAXSIZE: int = 100000
+    TICKET_CACHE_TTL_SECONDS: int = 300
+    ESCALATION_MODE: str = "timer"
+    ESCALATION_ALERT_REMAINING_PERCENT: float = 15.0
+    ESCALATION_RESYNC_SECONDS: int = 300
+    ESCALATION_BATCH_SIZE: int = 500
+    ESCALATION_PROFILE_RUNS: int = 0
+    PROFILE_OUTPUT_DIR: str = "profiles"
+    WEBHOOK_MAX_CONNECTIONS: int = 20
+    WEBHOOK_MAX_RETRIES: int = 3
+    WEBHOOK_BACKOFF_BASE_SECONDS: float = 0.5
+    WEBHOOK_BACKOFF_MAX_SECONDS: float = 10.0
+    SLACK_ALERT_MODE: str = "per_ticket"
+    SLACK_DIGEST_WINDOW_SECONDS: float = 0
+    SLACK_DIGEST_MAX_LINES: int = 50
+    SLACK_RATE_PER_SECOND: float = 1.0
+    SLACK_RATE_BURST: int = 3
+    OUTBOX_RETRY_BASE_SECONDS: float = 1.0
+    OUTBOX_RETRY_MAX_SECONDS: float = 300.0
+    OUTBOX_POLL_SECONDS: float = 1.0
+    OUTBOX_MAX_ATTEMPTS: int = 10
+    OUTBOX_LEASE_SECONDS: float = 600.0
+    WS_CLIENT_QUEUE_SIZE: int = 1000
+    WS_SEND_TIMEOUT_SECONDS: float = 5.0
+    WS_REPLAY_BUFFER_SIZE: int = 10000
+    ALERT_BACKBONE: str = "memory"
+    ALERT_BACKBONE_CHANNEL: str = "escalation_alerts"
     
     class Config:
         env_file = ".env"
@@ -1,20 +1,170 @@
+import hashlib
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Literal, Optional, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+from pydantic import BaseModel, Field
 
 from app.config.settings import settings
+from app.models.ticket import CustomerTier, Priority
 
 import yaml
 
+# Used for any priority/tier cell the YAML leaves out, unless it defines its own DEFAULT
+DEFAULT_RESPONSE_MINUTES = 60
+DEFAULT_RESOLUTION_MINUTES = 240
+
+# Column reserved for tickets without a customer tier
+NO_TIER = len(CustomerTier)
+
+# Alert sinks used when the YAML has no SINKS section
+DEFAULT_SINKS: List[Dict[str, Any]] = [
+    {"name": "slack", "type": "slack"},
+    {"name": "dashboard", "type": "websocket"},
+]
+
+
+class SinkConfig(BaseModel):
+    """One alert destination from the SINKS section, with its own delivery state, workers and circuit breaker."""
+
+    name: str
+    type: Literal["slack", "webhook", "websocket"]
+    enabled: bool = True
+    url: Optional[str] = None
+    endpoint: str = "/"
+    headers: Dict[str, str] = {}
+    workers: int = Field(1, ge=1)
+    batch_size: int = Field(50, ge=1)
+    linger_seconds: float = Field(0.0, ge=0)
+    timeout_seconds: float = Field(5.0, gt=0)
+    failure_threshold: int = Field(5, ge=1)
+    reset_seconds: float = Field(30.0, gt=0)
+
+
+class SLAMatrix:
+    """Priority x customer tier table of (response, resolution) minutes, compiled from the YAML."""
+
+    def __init__(self, minutes: npt.NDArray[np.int64]):
+        self.minutes = minutes
+
+    @classmethod
+    def compile(cls, config: Dict[str, Any]) -> "SLAMatrix":
+        """Raises ValueError naming the offending key when the YAML has an unknown name or a bad value."""
+        default = _section(config.get("DEFAULT"), "DEFAULT")
+        minutes = np.empty((len(Priority), NO_TIER + 1, 2), dtype=np.int64)
+        minutes[:, :, 0] = _minutes(default, "response_minutes", DEFAULT_RESPONSE_MINUTES, "DEFAULT")
+        minutes[:, :, 1] = _minutes(default, "resolution_minutes", DEFAULT_RESOLUTION_MINUTES, "DEFAULT")
+
+        for priority_name, tiers in _section(config.get("SLA"), "SLA").items():
+            priority = _member(Priority, priority_name, "SLA")
+            for tier_name, cell in _section(tiers, f"SLA.{priority_name}").items():
+                tier = _member(CustomerTier, tier_name, f"SLA.{priority_name}")
+                where = f"SLA.{priority_name}.{tier_name}"
+                cell = _section(cell, where)
+                minutes[priority, tier, 0] = _minutes(cell, "response_minutes", int(minutes[priority, tier, 0]), where)
+                minutes[priority, tier, 1] = _minutes(cell, "resolution_minutes", int(minutes[priority, tier, 1]), where)
+        return cls(minutes)
+
+    def cell(self, priority: Priority, tier: Optional[CustomerTier]) -> Tuple[int, int]:
+        response, resolution = self.minutes[priority, NO_TIER if tier is None else tier]
+        return int(response), int(resolution)
+
+    def changed_cells(self, other: "SLAMatrix") -> List[Tuple[Priority, Optional[CustomerTier]]]:
+        changed = np.argwhere((self.minutes != other.minutes).any(axis=2))
+        return [
+            (Priority(int(priority)), None if tier == NO_TIER else CustomerTier(int(tier)))
+            for priority, tier in changed
+        ]
+
+    def deadlines(
+        self,
+        priorities: Sequence[Priority],
+        tiers: Sequence[Optional[CustomerTier]],
+        created_at: Sequence[datetime],
+    ) -> Tuple[List[datetime], List[datetime]]:
+        """Response and resolution deadlines for a whole batch, as naive UTC datetimes."""
+        priority_idx = np.fromiter((int(p) for p in priorities), dtype=np.intp, count=len(priorities))
+        tier_idx = np.fromiter(
+            (NO_TIER if t is None else int(t) for t in tiers), dtype=np.intp, count=len(tiers)
+        )
+        created = np.array([_naive_utc(value) for value in created_at], dtype="datetime64[us]")
+
+        cells = self.minutes[priority_idx, tier_idx].astype("timedelta64[m]")
+        return (created + cells[:, 0]).tolist(), (created + cells[:, 1]).tolist()
+
+
+def _section(value: Any, where: str) -> Dict[str, Any]:
+    if value is None:
+        return {}
+    if not isinstance(value, dict):
+        raise ValueError(f"SLA config {where} must be a mapping, got {type(value).__name__}")
+    return value
+
+
+def _member(enum: Any, name: Any, where: str) -> Any:
+    try:
+        return enum[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown {enum.__name__} {name!r} in SLA config {where}; expected one of {', '.join(enum.__members__)}"
+        ) from None
+
+
+def _minutes(cell: Dict[str, Any], key: str, fallback: int, where: str) -> int:
+    value = cell.get(key, fallback)
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise ValueError(f"SLA config {where}.{key} must be a non-negative integer, got {value!r}")
+    return value
+
+
+def _naive_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
 
 class SLAConfig:
     _config: Dict[str, Any] = {}
+    _matrix: SLAMatrix = SLAMatrix.compile({})
+    _digest: Optional[str] = None
     _config_path: Path = Path(settings.SLA_CONFIG_PATH)
 
     @classmethod
-    def load_config(cls) -> None:
-        with open(cls._config_path, "r") as f:
-            cls._config = yaml.safe_load(f)
+    def load_config(cls) -> bool:
+        """(Re)load the YAML; returns False when the file content is unchanged since the last load."""
+        raw = cls._config_path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        if digest == cls._digest:
+            return False
+
+        config = yaml.safe_load(raw) or {}
+        if not isinstance(config, dict):
+            raise ValueError(f"SLA config {cls._config_path} must be a mapping at the top level")
+        # Validate and compile before publishing so readers never see a bad config or a mismatched matrix
+        matrix = SLAMatrix.compile(config)
+        cls._parse_sinks(config)
+        cls._config, cls._matrix, cls._digest = config, matrix, digest
+        return True
 
     @classmethod
     def get(cls) -> Dict[str, Any]:
         return cls._config
+
+    @classmethod
+    def matrix(cls) -> SLAMatrix:
+        return cls._matrix
+
+    @classmethod
+    def sinks(cls) -> List[SinkConfig]:
+        return cls._parse_sinks(cls._config)
+
+    @classmethod
+    def _parse_sinks(cls, config: Dict[str, Any]) -> List[SinkConfig]:
+        # pydantic's ValidationError is a ValueError, so a bad SINKS entry fails like a bad SLA cell
+        return [SinkConfig.model_validate(sink) for sink in config.get("SINKS") or DEFAULT_SINKS]
+
+    @classmethod
+    def path(cls) -> Path:
+        return cls._config_path
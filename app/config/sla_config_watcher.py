@@ -1,21 +1,76 @@
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
 
-from app.config.sla_config import SLAConfig
+from app.config.sla_config import SLAConfig, SLAMatrix
 from app.config.settings import settings
+from app.models.ticket import CustomerTier, Priority
 
+import logging
 import threading
 
+logger = logging.getLogger(__name__)
+
+WRITE_EVENTS = {"created", "modified", "moved", "closed"}
+
+SLAChangeCallback = Callable[[SLAMatrix, List[Tuple[Priority, Optional[CustomerTier]]]], None]
+
 class SLAConfigWatcher(FileSystemEventHandler):
-    def on_modified(self, event): # type: ignore
-        if event.src_path.endswith(settings.SLA_CONFIG_PATH): # type: ignore
-            print(vars(event))
-            print("[WATCH] SLA config changed. Reloading...")
-            SLAConfig.load_config()
+    """Reloads the SLA config once writes settle and hands the changed matrix cells to `on_change`."""
+
+    def __init__(self, on_change: SLAChangeCallback, debounce_seconds: float):
+        self.on_change = on_change
+        self.debounce_seconds = debounce_seconds
+        self._config_path = SLAConfig.path().resolve()
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def on_any_event(self, event: FileSystemEvent) -> None:
+        # Our own reads raise opened/closed_no_write events; only writes may trigger a reload
+        if event.event_type not in WRITE_EVENTS:
+            return
+        # Editors often save through a temp file and rename, so the destination counts too
+        paths = [event.src_path, getattr(event, "dest_path", "")]
+        if not any(path and Path(str(path)).resolve() == self._config_path for path in paths):
+            return
+
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.debounce_seconds, self._reload)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _reload(self) -> None:
+        previous = SLAConfig.matrix()
+        try:
+            if not SLAConfig.load_config():
+                logger.info("[WATCH] SLA config touched but content unchanged, skipping reload")
+                return
+        except Exception as e:
+            logger.error(f"[WATCH] SLA config reload failed, keeping previous config: {e}")
+            return
+
+        current = SLAConfig.matrix()
+        cells = previous.changed_cells(current)
+        logger.info(f"[WATCH] SLA config reloaded, {len(cells)} priority/tier cells changed")
+        if not cells:
+            return
+
+        try:
+            self.on_change(current, cells)
+        except Exception as e:
+            logger.exception(f"[WATCH] Recomputing deadlines after SLA change failed: {e}")
 
-def start_config_watcher():
+def start_config_watcher(on_change: SLAChangeCallback):
     observer = Observer()
-    observer.schedule(SLAConfigWatcher(), path=".", recursive=False)
+    observer.schedule(
+        SLAConfigWatcher(on_change, settings.SLA_CONFIG_RELOAD_DEBOUNCE_SECONDS),
+        path=str(SLAConfig.path().resolve().parent),
+        recursive=False,
+    )
     observer_thread = threading.Thread(target=observer.start)
     observer_thread.daemon = True
     observer_thread.start()
@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Query
+from typing import Any, Dict
+from app.services.instrumentation import instrumentation
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+@router.post(
+    "/profiling/escalation",
+    status_code=202,
+    summary="Profile the next N escalation runs and dump each to a .prof file",
+    description="Writes one pstat file per profiled run under PROFILE_OUTPUT_DIR on the server. "
+    "This endpoint has no authentication of its own: expose /admin only on an internal network "
+    "or behind an authenticating proxy.",
+)
+def profile_escalation_runs(runs: int = Query(1, ge=0, le=100)) -> Dict[str, Any]:
+    instrumentation.profile_next("escalation", runs)
+    return {
+        "pending_runs": runs,
+        "profile_dir": str(instrumentation.profile_dir),
+    }
@@ -0,0 +1,23 @@
+from fastapi import APIRouter
+from typing import Any, Dict
+from app.services.escalation_timer import escalation_timers
+from app.services.instrumentation import instrumentation
+from app.services.sinks.registry import alert_sinks
+from app.services.ticket_cache import ticket_cache
+from app.services.webhooks.webhook_dispatcher import webhook_dispatcher
+from app.websocket.backbone import alert_backbone
+from app.websocket.manager import manager
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+@router.get("/", status_code=200, summary="In-process runtime metrics")
+def get_metrics() -> Dict[str, Any]:
+    return {
+        "ticket_cache": ticket_cache.stats(),
+        "escalation_timers": escalation_timers.stats(),
+        "runs": instrumentation.stats(),
+        "webhooks": webhook_dispatcher.stats(),
+        "alert_sinks": alert_sinks.stats(),
+        "websocket": manager.stats(),
+        "alert_backbone": alert_backbone.stats(),
+    }
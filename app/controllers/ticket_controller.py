@@ -1,16 +1,65 @@
-from fastapi import APIRouter, Query, Response
+from fastapi import APIRouter, Query, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
 from typing import List, Optional
+from app.config.settings import settings
 from app.dto.dashboard_response import DashboardResponse
-from app.models.ticket import Ticket, TicketStatus
+from app.dto.ingestion_job_response import IngestionJobAccepted, IngestionJobResponse
+from app.dto.ingestion_response import IngestionResponse, StreamIngestionResponse
+from app.dto.ticket_ingest import TicketIngest, TicketIngestBatch
+from app.exceptions.exceptions import NotFoundException
+from app.models.ticket import TicketStatus
+from app.services.ingestion_queue import ingestion_queue
 from app.services.ticket_service import TicketService
+from app.utils.ndjson import iter_ndjson_lines
 
 router = APIRouter(prefix="/tickets", tags=["Tickets"])
 ticket_service = TicketService()
 
-@router.post("/", status_code=201)
-def ingest_tickets(tickets: List[Ticket], response: Response):
-    ticket_service.process_tickets(tickets)
-    return {"message": "Tickets processed"}
+def _parse_ticket_batch(body: bytes) -> List[TicketIngest]:
+    try:
+        return TicketIngestBatch.validate_json(body)
+    except ValidationError as validation_error:
+        errors = [
+            {**error, "loc": ("body", *error["loc"])}
+            for error in validation_error.errors(include_url=False)
+        ]
+        raise RequestValidationError(errors, body=body)
+
+@router.post("/", response_model=IngestionResponse, status_code=201)
+async def ingest_tickets(request: Request):
+    tickets = _parse_ticket_batch(await request.body())
+    return await run_in_threadpool(ticket_service.process_tickets, tickets)
+
+@router.post(
+    "/stream",
+    response_model=StreamIngestionResponse,
+    status_code=201,
+    summary="Ingest tickets from an NDJSON body, committing in fixed-size chunks",
+)
+async def ingest_tickets_stream(request: Request):
+    return await ticket_service.process_ticket_stream(
+        iter_ndjson_lines(request.stream()),
+        chunk_size=settings.INGESTION_CHUNK_SIZE,
+    )
+
+@router.post(
+    "/jobs",
+    response_model=IngestionJobAccepted,
+    status_code=202,
+    summary="Validate and enqueue a batch of tickets for background ingestion",
+)
+async def enqueue_tickets(request: Request):
+    job = ingestion_queue.submit(_parse_ticket_batch(await request.body()))
+    return IngestionJobAccepted(job_id=job.job_id, status=job.status, received=job.received)
+
+@router.get("/jobs/{job_id}", response_model=IngestionJobResponse, status_code=200)
+def get_ingestion_job(job_id: str):
+    job = ingestion_queue.get(job_id)
+    if job is None:
+        raise NotFoundException("Ingestion job not found.")
+    return job
 
 @router.get(
     "/dashboard",
@@ -25,11 +74,30 @@ def get_dashboard(
     ),
     page: int = Query(1, ge=1, description="Page number (starts in 1)"),
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(
+        None,
+        description="Keyset pagination by resolution deadline: pass empty for the first page, "
+        "then the previous response's next_cursor. Ignores `page`.",
+    ),
+    exact: bool = Query(
+        False,
+        description="Count matching tickets in the table instead of reading the maintained status counters",
+    ),
 ):
+    if cursor is not None:
+        tickets, total, next_cursor = ticket_service.get_tickets_by_cursor(
+            status=status,
+            cursor=cursor,
+            page_size=page_size,
+            exact=exact,
+        )
+        return DashboardResponse(tickets=tickets, total=total, next_cursor=next_cursor)
+
     tickets, total = ticket_service.get_tickets_paginated(
         status=status,
         page=page,
         page_size=page_size,
+        exact=exact,
     )
     return DashboardResponse(tickets=tickets, total=total)
 
@@ -0,0 +1,14 @@
+from datetime import datetime
+from pydantic import BaseModel
+from typing import Optional
+
+from app.models.ticket import CustomerTier, EscalationLevel, Priority
+
+class AlertEvent(BaseModel):
+    seq: int
+    event: EscalationLevel
+    ticket_id: int
+    remaining_percent: float
+    priority: Optional[Priority] = None
+    customer_tier: Optional[CustomerTier] = None
+    created_at: datetime
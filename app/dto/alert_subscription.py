@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+from app.models.ticket import CustomerTier, EscalationLevel, Priority
+
+class AlertSubscription(BaseModel):
+    """Filters a /ws/alerts client sends to narrow its feed; omitted fields match everything."""
+
+    ticket_ids: Optional[List[int]] = None
+    events: Optional[List[EscalationLevel]] = None
+    priorities: Optional[List[Priority]] = None
+    customer_tiers: Optional[List[CustomerTier]] = None
+    # Only events at or below this remaining percent (breaches are always below)
+    max_remaining_percent: Optional[float] = None
@@ -1,7 +1,9 @@
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
 from app.dto.ticket_response import TicketResponse
 
 class DashboardResponse(BaseModel):
     tickets: List[TicketResponse]
     total: int
+    # Pass back as `cursor` for the next page; None on the last page or in page mode
+    next_cursor: Optional[str] = None
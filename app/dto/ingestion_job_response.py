@@ -0,0 +1,25 @@
+from datetime import datetime
+from enum import StrEnum
+from pydantic import BaseModel
+from typing import List, Optional
+
+from app.dto.ingestion_response import IngestionCounts
+
+class IngestionJobStatus(StrEnum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+class IngestionJobResponse(IngestionCounts):
+    job_id: str
+    status: IngestionJobStatus = IngestionJobStatus.QUEUED
+    processed: int = 0
+    errors: List[str] = []
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+class IngestionJobAccepted(BaseModel):
+    job_id: str
+    status: IngestionJobStatus
+    received: int
@@ -0,0 +1,27 @@
+from pydantic import BaseModel
+from typing import List
+
+class FailedTicket(BaseModel):
+    id: int
+    error: str
+
+class IngestionCounts(BaseModel):
+    received: int = 0
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0
+    failed: List[FailedTicket] = []
+
+class IngestionResponse(IngestionCounts):
+    message: str = "Tickets processed"
+
+class ChunkIngestionResponse(IngestionCounts):
+    chunk: int
+    first_line: int
+    last_line: int
+    committed: bool = False
+    errors: List[str] = []
+
+class StreamIngestionResponse(BaseModel):
+    message: str = "Ticket stream processed"
+    chunks: List[ChunkIngestionResponse] = []
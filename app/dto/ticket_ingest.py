@@ -0,0 +1,23 @@
+from datetime import datetime, timezone
+from pydantic import BaseModel, Field, Strict, TypeAdapter
+from typing import Annotated, List, Optional
+
+from app.models.ticket import CustomerTier, EscalationLevel, Priority, TicketStatus
+
+# Only RFC 3339 strings are accepted when decoding JSON; no epoch numbers or loose formats
+StrictDatetime = Annotated[datetime, Strict()]
+
+class TicketIngest(BaseModel):
+    id: int
+    priority: Priority = Priority.LOW
+    customer_tier: Optional[CustomerTier] = None
+    created_at: StrictDatetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: StrictDatetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    status: TicketStatus = TicketStatus.OPEN
+    escalation_level: Optional[EscalationLevel] = None
+    resolved_at: Optional[StrictDatetime] = None
+    # Ignored on ingestion: deadlines are computed from the SLA matrix
+    response_sla_deadline: Optional[StrictDatetime] = None
+    resolution_sla_deadline: Optional[StrictDatetime] = None
+
+TicketIngestBatch = TypeAdapter(List[TicketIngest])
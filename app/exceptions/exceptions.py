@@ -1,3 +1,5 @@
+from typing import Iterable
+
 class DBException(Exception):
     pass
 
@@ -8,4 +10,14 @@ class UseCaseException(Exception):
     pass
 
 class NotFoundException(Exception):
-    pass
\ No newline at end of file
+    pass
+
+class QueueFullException(Exception):
+    pass
+
+class PartialDeliveryException(Exception):
+    """Raised by an alert sink that delivered only part of a batch; `failed` holds the seqs to retry."""
+
+    def __init__(self, message: str, failed: Iterable[int]):
+        super().__init__(message)
+        self.failed = set(failed)
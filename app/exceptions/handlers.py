@@ -1,7 +1,7 @@
 from asyncio.log import logger
 from fastapi import Request
 from fastapi.responses import JSONResponse
-from app.exceptions.exceptions import NotFoundException, UseCaseException, DBException
+from app.exceptions.exceptions import NotFoundException, QueueFullException, UseCaseException, DBException
 
 async def use_case_exception_handler(request: Request, exc: UseCaseException):
     logger.exception(f"UseCaseException on {request.url.path}: {exc}")
@@ -55,3 +55,16 @@ async def not_found_exception_handler(request: Request, exc: NotFoundException):
         }
     )
 
+async def queue_full_exception_handler(request: Request, exc: QueueFullException):
+    logger.warning(f"QueueFullException on {request.url.path}: {exc}")
+    return JSONResponse(
+        status_code=429,
+        headers={"Retry-After": "1"},
+        content={
+            "error": {
+                "type": "QueueFullException",
+                "message": str(exc),
+                "path": request.url.path
+            }
+        }
+    )
@@ -0,0 +1,34 @@
+from datetime import datetime, timezone
+from typing import Optional
+from sqlalchemy import BigInteger, Column, DateTime, Enum, Integer, func
+from sqlmodel import Field, SQLModel
+
+from app.models.ticket import CustomerTier, EscalationLevel, Priority
+
+
+class EscalationOutbox(SQLModel, table=True):
+    """Escalation notifications written with the level change; each sink's delivery is tracked separately."""
+
+    __tablename__ = "escalation_outbox" # type: ignore
+
+    id: Optional[int] = Field(default=None, sa_column=Column(BigInteger, primary_key=True, autoincrement=True))
+    ticket_id: int = Field(sa_column=Column(Integer, nullable=False))
+
+    event: EscalationLevel = Field(
+        sa_column=Column(Enum(EscalationLevel, name="escalation_level_enum"), nullable=False)
+    )
+    remaining_percent: float
+
+    priority: Optional[Priority] = Field(
+        default=None,
+        sa_column=Column(Enum(Priority, name="priority_enum"), nullable=True)
+    )
+    customer_tier: Optional[CustomerTier] = Field(
+        default=None,
+        sa_column=Column(Enum(CustomerTier, name="customer_tier_enum"), nullable=True)
+    )
+
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
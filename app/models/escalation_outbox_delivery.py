@@ -0,0 +1,32 @@
+from datetime import datetime, timezone
+from typing import Optional
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Index, Integer, String, func, text
+from sqlmodel import Field, SQLModel
+
+
+class EscalationOutboxDelivery(SQLModel, table=True):
+    """One alert sink's delivery state for one outbox event; done only once that sink accepted it."""
+
+    __tablename__ = "escalation_outbox_delivery" # type: ignore
+    __table_args__ = (
+        Index(
+            "ix_escalation_outbox_delivery_pending", "sink", "outbox_id",
+            postgresql_where=text("delivered_at IS NULL"),
+        ),
+    )
+
+    outbox_id: int = Field(
+        sa_column=Column(BigInteger, ForeignKey("escalation_outbox.id", ondelete="CASCADE"), primary_key=True)
+    )
+    sink: str = Field(sa_column=Column(String, primary_key=True))
+    delivered_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=True)
+    )
+    attempts: int = Field(default=0, sa_column=Column(Integer, nullable=False, server_default="0"))
+    # Failed deliveries back off: the row is not claimed again before this
+    next_attempt_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
+    last_error: Optional[str] = None
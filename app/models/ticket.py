@@ -29,6 +29,9 @@ class Ticket(SQLModel, table=True):
     __table_args__ = (
         Index("ix_ticket_priority", "priority"),
         Index("ix_ticket_customer_tier", "customer_tier"),
+        # Keyset pagination of the dashboard, with and without the status filter
+        Index("ix_ticket_deadline_id", "resolution_sla_deadline", "id"),
+        Index("ix_ticket_status_deadline_id", "status", "resolution_sla_deadline", "id"),
     )
 
     id: int = Field(default=None, sa_column=Column(Integer, primary_key=True, autoincrement=False, nullable=False))
@@ -58,7 +61,14 @@ class Ticket(SQLModel, table=True):
         sa_column=Column(Enum(TicketStatus, name="ticket_status_enum"), nullable=False, default=0)
     )
 
-    escalation_level: Optional[EscalationLevel]
+    escalation_level: Optional[EscalationLevel] = Field(
+        default=None,
+        sa_column=Column(Enum(EscalationLevel, name="escalation_level_enum"), nullable=True)
+    )
+    escalated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=True)
+    )
     resolved_at: Optional[datetime] = Field(default=None)
     response_sla_deadline: datetime = Field(default=None, nullable=False)
     resolution_sla_deadline: Optional[datetime] = Field(default=None, nullable=False)
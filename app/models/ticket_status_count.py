@@ -0,0 +1,74 @@
+from sqlalchemy import DDL, BigInteger, Column, Enum, event
+from sqlmodel import Field, SQLModel
+
+from app.models.ticket import Ticket, TicketStatus
+
+
+class TicketStatusCount(SQLModel, table=True):
+    """Number of tickets per status, kept current by triggers on the ticket table."""
+
+    __tablename__ = "ticket_status_count" # type: ignore
+
+    status: TicketStatus = Field(
+        sa_column=Column(Enum(TicketStatus, name="ticket_status_enum"), primary_key=True)
+    )
+    count: int = Field(sa_column=Column(BigInteger, nullable=False, server_default="0"))
+
+
+# Statement-level triggers see every row a bulk upsert touched, with its status before and after, in the
+# writer's own transaction. Rows whose status did not change (escalation, deadline recompute) touch no counter.
+# Counter rows are always locked in status order, so concurrent writers queue on them rather than deadlock.
+STATUS_COUNT_TRIGGER_SQL = (
+    """
+    CREATE OR REPLACE FUNCTION ticket_status_count_apply() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            INSERT INTO ticket_status_count (status, count)
+            SELECT status, count(*) FROM new_rows GROUP BY status ORDER BY status
+            ON CONFLICT (status) DO UPDATE SET count = ticket_status_count.count + excluded.count;
+        ELSIF TG_OP = 'DELETE' THEN
+            INSERT INTO ticket_status_count (status, count)
+            SELECT status, -count(*) FROM old_rows GROUP BY status ORDER BY status
+            ON CONFLICT (status) DO UPDATE SET count = ticket_status_count.count + excluded.count;
+        ELSE
+            INSERT INTO ticket_status_count (status, count)
+            SELECT status, sum(delta) FROM (
+                SELECT o.status, -1 AS delta FROM old_rows o JOIN new_rows n USING (id)
+                WHERE o.status IS DISTINCT FROM n.status
+                UNION ALL
+                SELECT n.status, 1 AS delta FROM old_rows o JOIN new_rows n USING (id)
+                WHERE o.status IS DISTINCT FROM n.status
+            ) changes
+            GROUP BY status HAVING sum(delta) <> 0 ORDER BY status
+            ON CONFLICT (status) DO UPDATE SET count = ticket_status_count.count + excluded.count;
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER ticket_status_count_insert AFTER INSERT ON ticket
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION ticket_status_count_apply()
+    """,
+    """
+    CREATE TRIGGER ticket_status_count_update AFTER UPDATE ON ticket
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION ticket_status_count_apply()
+    """,
+    """
+    CREATE TRIGGER ticket_status_count_delete AFTER DELETE ON ticket
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION ticket_status_count_apply()
+    """,
+    # Tickets that existed before the counters did
+    """
+    INSERT INTO ticket_status_count (status, count)
+    SELECT status, count(*) FROM ticket GROUP BY status
+    """,
+)
+
+# create_all deployments get the triggers too, once, when the counter table is first created
+TicketStatusCount.__table__.add_is_dependent_on(Ticket.__table__) # type: ignore
+for _statement in STATUS_COUNT_TRIGGER_SQL:
+    event.listen(TicketStatusCount.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql")) # type: ignore
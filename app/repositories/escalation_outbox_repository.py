@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta
+from typing import Any, Collection, Dict, List, Sequence
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import Interval, func, insert, literal, update
+
+from app.models.escalation_outbox import EscalationOutbox
+from app.models.escalation_outbox_delivery import EscalationOutboxDelivery
+
+_ONE_SECOND = literal(timedelta(seconds=1), Interval())
+
+class EscalationOutboxRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def add(self, rows: List[Dict[str, Any]], sinks: Collection[str]) -> None:
+        """Write the events plus one pending delivery per sink, in the caller's transaction."""
+        if not rows:
+            return
+        table = EscalationOutbox.__table__ # type: ignore
+        result = await self.session.execute(insert(table).values(rows).returning(table.c.id))
+        ids = result.scalars().all()
+        if not sinks:
+            return
+        await self.session.execute(
+            insert(EscalationOutboxDelivery.__table__).values([ # type: ignore
+                {"outbox_id": outbox_id, "sink": sink} for outbox_id in ids for sink in sinks
+            ])
+        )
+
+    async def claim_pending(
+        self, sink: str, limit: int, max_attempts: int, lease_seconds: float
+    ) -> Sequence[EscalationOutbox]:
+        """Lease up to `limit` due deliveries to the caller and count the attempt.
+
+        The lease pushes `next_attempt_at` out, so once the caller commits, no other worker claims these rows
+        while it delivers outside any transaction; if it dies first, they become due again when the lease ends.
+        """
+        # Concurrent workers (this sink's other workers, other replicas) skip rows already claimed
+        due = (
+            select(EscalationOutboxDelivery.outbox_id)
+            .where(EscalationOutboxDelivery.sink == sink)
+            .where(EscalationOutboxDelivery.delivered_at.is_(None)) # type: ignore
+            .where(EscalationOutboxDelivery.attempts < max_attempts)
+            .where(EscalationOutboxDelivery.next_attempt_at <= func.now())
+            .order_by(EscalationOutboxDelivery.outbox_id) # type: ignore
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte("due")
+        )
+        result = await self.session.execute(
+            update(EscalationOutboxDelivery)
+            .where(EscalationOutboxDelivery.sink == sink)
+            .where(EscalationOutboxDelivery.outbox_id.in_(select(due.c.outbox_id))) # type: ignore
+            .values(
+                attempts=EscalationOutboxDelivery.attempts + 1,
+                next_attempt_at=func.now() + lease_seconds * _ONE_SECOND,
+            )
+            .returning(EscalationOutboxDelivery.outbox_id)
+        )
+        ids = result.scalars().all()
+        if not ids:
+            return []
+        entries = await self.session.exec(
+            select(EscalationOutbox).where(EscalationOutbox.id.in_(ids)).order_by(EscalationOutbox.id) # type: ignore
+        )
+        return entries.all()
+
+    async def mark_delivered(self, sink: str, ids: Collection[int], delivered_at: datetime) -> None:
+        if not ids:
+            return
+        await self.session.execute(
+            update(EscalationOutboxDelivery)
+            .where(EscalationOutboxDelivery.sink == sink)
+            .where(EscalationOutboxDelivery.outbox_id.in_(ids)) # type: ignore
+            .values(delivered_at=delivered_at)
+        )
+
+    async def mark_failed(
+        self, sink: str, ids: Collection[int], error: str, backoff_base_seconds: float, backoff_max_seconds: float
+    ) -> None:
+        if not ids:
+            return
+        # Exponential backoff per row: base * 2^(attempts - 1), capped; the claim already counted this attempt
+        delay_seconds = func.least(
+            backoff_max_seconds, backoff_base_seconds * func.power(2, EscalationOutboxDelivery.attempts - 1)
+        )
+        await self.session.execute(
+            update(EscalationOutboxDelivery)
+            .where(EscalationOutboxDelivery.sink == sink)
+            .where(EscalationOutboxDelivery.outbox_id.in_(ids)) # type: ignore
+            .values(last_error=error, next_attempt_at=func.now() + delay_seconds * _ONE_SECOND)
+        )
@@ -0,0 +1,87 @@
+from datetime import datetime
+from typing import Any, Collection, Optional, Sequence, Tuple
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import ColumnElement, DateTime, Float, Row, and_, cast, func, literal, or_, update
+
+from app.models.ticket import EscalationLevel, Ticket
+
+def resolution_deadline_utc() -> ColumnElement[datetime]:
+    # Deadlines are stored as naive UTC timestamps, created_at as timestamptz
+    return func.timezone("UTC", Ticket.resolution_sla_deadline)
+
+def epoch_seconds(value: ColumnElement[datetime]) -> ColumnElement[float]:
+    return cast(func.extract("epoch", value), Float)
+
+def remaining_sla_percent(now: datetime) -> ColumnElement[float]:
+    """Share of the resolution window still left at `now`, as a SQL expression (<= 0 once breached)."""
+    deadline = resolution_deadline_utc()
+    window_seconds = func.extract("epoch", deadline - Ticket.created_at)
+    remaining_seconds = func.extract("epoch", deadline - literal(now, DateTime(timezone=True)))
+    return cast(remaining_seconds / func.nullif(window_seconds, 0) * 100, Float)
+
+class TicketEscalationRepository:
+    """Escalation queries, run on the async engine so the escalation pipeline never blocks the event loop."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_escalation_candidates(
+        self,
+        now: datetime,
+        max_remaining_percent: float,
+        ticket_ids: Optional[Collection[int]] = None,
+        limit: Optional[int] = None,
+    ) -> Sequence[Row[Any]]:
+        remaining_percent = remaining_sla_percent(now)
+        # Edge-triggered: only tickets that would move to a new escalation level
+        stmt = (
+            select(
+                Ticket.id,
+                Ticket.priority,
+                Ticket.customer_tier,
+                Ticket.escalation_level,
+                epoch_seconds(Ticket.created_at).label("created_epoch"),
+                epoch_seconds(resolution_deadline_utc()).label("deadline_epoch"),
+            )
+            .where(Ticket.status == "OPEN")
+            .where(or_(
+                and_(
+                    remaining_percent <= 0,
+                    Ticket.escalation_level.is_distinct_from(EscalationLevel.BREACH), # type: ignore
+                ),
+                and_(
+                    remaining_percent > 0,
+                    remaining_percent <= max_remaining_percent,
+                    Ticket.escalation_level.is_(None), # type: ignore
+                ),
+            ))
+        )
+        if ticket_ids is not None:
+            stmt = stmt.where(Ticket.id.in_(ticket_ids)) # type: ignore
+        if limit is not None:
+            stmt = stmt.order_by(Ticket.id).limit(limit)
+        # Rows claimed by a concurrent escalation run are skipped rather than waited on
+        result = await self.session.exec(stmt.with_for_update(of=Ticket, skip_locked=True)) # type: ignore
+        return result.all()
+
+    async def set_escalation_level(
+        self, ticket_ids: Collection[int], level: EscalationLevel, escalated_at: datetime
+    ) -> None:
+        if not ticket_ids:
+            return
+        await self.session.execute(
+            update(Ticket)
+            .where(Ticket.id.in_(ticket_ids)) # type: ignore
+            # updated_at mirrors the upstream system, escalation must not bump it via onupdate
+            .values(escalation_level=level, escalated_at=escalated_at, updated_at=Ticket.updated_at)
+        )
+
+    async def get_open_deadlines(self) -> Sequence[Tuple[int, datetime, datetime, Optional[EscalationLevel]]]:
+        result = await self.session.exec(
+            select(Ticket.id, Ticket.created_at, Ticket.resolution_sla_deadline, Ticket.escalation_level)
+            .where(Ticket.status == "OPEN")
+            .where(Ticket.resolution_sla_deadline.is_not(None)) # type: ignore
+            .where(Ticket.escalation_level.is_distinct_from(EscalationLevel.BREACH)) # type: ignore
+        )
+        return result.all()
@@ -1,22 +1,37 @@
 from datetime import datetime, timezone
+from typing import Any, Dict, Sequence
 from sqlmodel import Session
+from sqlalchemy import insert
 
+from app.dto.ticket_ingest import TicketIngest
 from app.models.ticket import Ticket
 from app.models.ticket_history import TicketHistory
+from app.repositories.ticket_repository import BULK_INSERT_CHUNK_SIZE
 
 class TicketHistoryRepository:
     def __init__(self, session: Session):
         self.session = session
 
     def save(self, ticket: Ticket, change_type: str = "UPDATE") -> None:
-        history = TicketHistory(
-            ticket_id=ticket.id,
-            priority=ticket.priority,
-            customer_tier=ticket.customer_tier,
-            created_at=ticket.created_at,
-            updated_at=ticket.updated_at,
-            status=ticket.status,
-            changed_at=datetime.now(timezone.utc),
-            change_type=change_type
-        )
-        self.session.add(history)
\ No newline at end of file
+        history = TicketHistory(**self._to_row(ticket, change_type, datetime.now(timezone.utc)))
+        self.session.add(history)
+
+    def bulk_save(self, tickets: Sequence[TicketIngest], change_type: str = "UPDATE") -> None:
+        changed_at = datetime.now(timezone.utc)
+        rows = [self._to_row(ticket, change_type, changed_at) for ticket in tickets]
+
+        table = TicketHistory.__table__ # type: ignore
+        for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+            self.session.execute(insert(table).values(rows[start:start + BULK_INSERT_CHUNK_SIZE]))
+
+    def _to_row(self, ticket: Ticket | TicketIngest, change_type: str, changed_at: datetime) -> Dict[str, Any]:
+        return {
+            "ticket_id": ticket.id,
+            "priority": ticket.priority,
+            "customer_tier": ticket.customer_tier,
+            "created_at": ticket.created_at,
+            "updated_at": ticket.updated_at,
+            "status": ticket.status,
+            "changed_at": changed_at,
+            "change_type": change_type,
+        }
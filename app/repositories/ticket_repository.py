@@ -1,8 +1,41 @@
-from typing import Optional, Sequence, Tuple
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 from sqlmodel import Session, select
-from sqlalchemy import func
+from sqlalchemy import ColumnElement, Interval, RowMapping, and_, case, func, literal, null, or_, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
 
-from app.models.ticket import Ticket, TicketStatus
+from app.models.ticket import CustomerTier, EscalationLevel, Priority, Ticket, TicketStatus
+from app.repositories.ticket_status_count_repository import TicketStatusCountRepository
+from app.utils.cursor import DashboardCursor
+
+BULK_INSERT_CHUNK_SIZE = 1000
+
+# Columns an incoming ticket is allowed to overwrite on an existing row
+UPSERT_COLUMNS = (
+    "priority",
+    "updated_at",
+    "created_at",
+    "status",
+    "customer_tier",
+    "response_sla_deadline",
+    "resolution_sla_deadline",
+)
+
+def capped_escalation_level(
+    level: ColumnElement[Any],
+    created_utc: ColumnElement[datetime],
+    deadline: ColumnElement[datetime],
+    alert_remaining_percent: float,
+) -> ColumnElement[Any]:
+    """`level` lowered to what the (new) deadline justifies right now: NULL before the alert window,
+    at most ALERT before the deadline. Never raised, so escalation still sends the notifications."""
+    now = func.timezone("UTC", func.now())
+    alert_at = created_utc + (deadline - created_utc) * (1 - alert_remaining_percent / 100)
+    return case(
+        (alert_at > now, null()),
+        (and_(deadline > now, level == EscalationLevel.BREACH), literal(EscalationLevel.ALERT, Ticket.__table__.c.escalation_level.type)), # type: ignore
+        else_=level,
+    )
 
 class TicketRepository:
     def __init__(self, session: Session) -> None:
@@ -13,20 +46,98 @@ class TicketRepository:
             select(Ticket).where(Ticket.id == ticket_id)
         ).first()
 
-    def get_open_tickets(self) -> Sequence[Ticket]:
-        return self.session.exec(
-            select(Ticket).where(Ticket.status == "OPEN")
-        ).all()
+    def get_rows_by_ids(self, ticket_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        ids = list(ticket_ids)
+        if not ids:
+            return {}
+
+        table = Ticket.__table__ # type: ignore
+        rows = self.session.execute(
+            table.select().where(table.c.id.in_(ids))
+        ).mappings()
+        return {row["id"]: dict(row) for row in rows}
 
     def save(self, ticket: Ticket) -> None:
         self.session.add(ticket)
-        
+
+    def bulk_upsert(self, rows: List[Dict[str, Any]], alert_remaining_percent: float) -> Dict[int, Optional[EscalationLevel]]:
+        """Insert or update `rows`; returns each written ticket's escalation level as stored."""
+        table = Ticket.__table__ # type: ignore
+        # Multi-row VALUES needs one key set; columns an incoming ticket lacks are left NULL
+        rows = [{column: row.get(column) for column in table.c.keys()} for row in rows]
+        levels: Dict[int, Optional[EscalationLevel]] = {}
+        for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+            stmt = insert(table).values(rows[start:start + BULK_INSERT_CHUNK_SIZE])
+            excluded = stmt.excluded
+            # Evaluated against the locked current row, so a concurrent escalation is never overwritten
+            reopened = and_(table.c.status != TicketStatus.OPEN, excluded.status == TicketStatus.OPEN)
+            deadline_moved = or_(
+                table.c.priority.is_distinct_from(excluded.priority),
+                table.c.customer_tier.is_distinct_from(excluded.customer_tier),
+                table.c.created_at.is_distinct_from(excluded.created_at),
+            )
+            level = case(
+                # A re-opened ticket escalates again from scratch
+                (reopened, null()),
+                (deadline_moved, capped_escalation_level(
+                    table.c.escalation_level,
+                    func.timezone("UTC", excluded.created_at),
+                    excluded.resolution_sla_deadline,
+                    alert_remaining_percent,
+                )),
+                else_=table.c.escalation_level,
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.id],
+                set_={
+                    **{column: excluded[column] for column in UPSERT_COLUMNS},
+                    "escalation_level": level,
+                    "escalated_at": case((level.is_(None), null()), else_=table.c.escalated_at),
+                },
+            ).returning(table.c.id, table.c.escalation_level)
+            levels.update({row.id: row.escalation_level for row in self.session.execute(stmt)})
+        return levels
+
+    def recompute_open_deadlines(
+        self,
+        priority: Priority,
+        customer_tier: Optional[CustomerTier],
+        response_minutes: int,
+        resolution_minutes: int,
+        alert_remaining_percent: float,
+    ) -> Sequence[RowMapping]:
+        # Deadlines are stored as naive UTC, created_at as timestamptz
+        created_utc = func.timezone("UTC", Ticket.created_at)
+        resolution_deadline = created_utc + literal(timedelta(minutes=resolution_minutes), Interval())
+        # SET expressions see the old row, so the level is judged against the new deadline expression
+        level = capped_escalation_level(Ticket.escalation_level, created_utc, resolution_deadline, alert_remaining_percent) # type: ignore
+        tier_matches = (
+            Ticket.customer_tier.is_(None) # type: ignore
+            if customer_tier is None else Ticket.customer_tier == customer_tier
+        )
+        return self.session.execute(
+            update(Ticket)
+            .where(Ticket.status == "OPEN")
+            .where(Ticket.priority == priority)
+            .where(tier_matches)
+            .values(
+                response_sla_deadline=created_utc + literal(timedelta(minutes=response_minutes), Interval()),
+                resolution_sla_deadline=resolution_deadline,
+                escalation_level=level,
+                escalated_at=case((level.is_(None), null()), else_=Ticket.escalated_at),
+                # updated_at mirrors the upstream system, a config change must not bump it via onupdate
+                updated_at=Ticket.updated_at,
+            )
+            .returning(Ticket.id, Ticket.status, Ticket.created_at, Ticket.resolution_sla_deadline, Ticket.escalation_level)
+        ).mappings().all()
+
     def get_paginated(
         self,
         *,
         status: Optional[TicketStatus] = None,
         page: int = 1,
         page_size: int = 10,
+        exact_total: bool = False,
     ) -> Tuple[Sequence[Ticket], int]:
         offset = (page - 1) * page_size
 
@@ -34,15 +145,36 @@ class TicketRepository:
         if status is not None:
             stmt = stmt.where(Ticket.status == status)
 
-        count_stmt = select(func.count()).select_from(Ticket)
-        if status is not None:
-            count_stmt = count_stmt.where(Ticket.status == status)
-        total = self.session.exec(count_stmt).one()
+        total = self.count(status=status) if exact_total else TicketStatusCountRepository(self.session).total(status)
 
         paginated = (
             self.session
-            .exec(stmt.offset(offset).limit(page_size))
+            # Without an ORDER BY, Postgres may return rows in a different order on every request
+            .exec(stmt.order_by(Ticket.id).offset(offset).limit(page_size))
             .all()
         )
 
-        return paginated, total
\ No newline at end of file
+        return paginated, total
+
+    def count(self, *, status: Optional[TicketStatus] = None) -> int:
+        count_stmt = select(func.count()).select_from(Ticket)
+        if status is not None:
+            count_stmt = count_stmt.where(Ticket.status == status)
+        return self.session.exec(count_stmt).one()
+
+    def get_page_after(
+        self,
+        *,
+        status: Optional[TicketStatus] = None,
+        after: Optional[DashboardCursor] = None,
+        limit: int = 10,
+    ) -> Sequence[Ticket]:
+        """Keyset page ordered by (resolution_sla_deadline, id): seeks past `after` on the index
+        instead of reading and discarding every earlier row like OFFSET does."""
+        stmt = select(Ticket)
+        if status is not None:
+            stmt = stmt.where(Ticket.status == status)
+        if after is not None:
+            stmt = stmt.where(tuple_(Ticket.resolution_sla_deadline, Ticket.id) > tuple_(*after))
+        stmt = stmt.order_by(Ticket.resolution_sla_deadline, Ticket.id).limit(limit) # type: ignore
+        return self.session.exec(stmt).all()
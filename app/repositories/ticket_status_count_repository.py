@@ -0,0 +1,18 @@
+from typing import Optional
+from sqlmodel import Session, select
+from sqlalchemy import func
+
+from app.models.ticket import TicketStatus
+from app.models.ticket_status_count import TicketStatusCount
+
+class TicketStatusCountRepository:
+    """Reads the per-status ticket counters; the ticket table's triggers are the only writers."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def total(self, status: Optional[TicketStatus] = None) -> int:
+        stmt = select(func.coalesce(func.sum(TicketStatusCount.count), 0))
+        if status is not None:
+            stmt = stmt.where(TicketStatusCount.status == status)
+        return int(self.session.exec(stmt).one())
@@ -0,0 +1,218 @@
+import asyncio
+import heapq
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Collection, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from app.config.settings import settings
+from app.models.ticket import EscalationLevel, TicketStatus
+
+logger = logging.getLogger(__name__)
+
+# Fire slightly after the exact instant so the SQL threshold check cannot lose to float rounding
+FIRE_GRACE_SECONDS = 0.05
+
+# Backoff for tickets whose escalation failed, so they are retried well before the next resync
+RETRY_BASE_SECONDS = 1.0
+RETRY_MAX_SECONDS = 60.0
+
+# Heap entry kinds
+ALERT, BREACH, RETRY = 0, 1, 2
+
+EscalateCallback = Callable[[Collection[int]], Awaitable[None]]
+LoadCallback = Callable[[], Awaitable[Sequence[Tuple[int, datetime, datetime, Optional[EscalationLevel]]]]]
+Instants = Optional[Tuple[float, float]]
+
+def _epoch(value: datetime) -> float:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+class EscalationTimerQueue:
+    """Deadline-ordered heap holding the next alert/breach instant of every tracked open ticket.
+
+    Ingestion threads may call `track` from any thread; `resync` runs on the event loop, which is
+    the only place the heap itself is touched.
+    """
+
+    def __init__(self, alert_remaining_percent: float):
+        self.alert_fraction = 1 - alert_remaining_percent / 100
+        # (fire_at, ticket_id, version, kind); stale versions are dropped lazily when popped
+        self._heap: List[Tuple[float, int, int, int]] = []
+        self._deadlines: Dict[int, Tuple[float, float, int]] = {}
+        # ticket_id -> (failed attempts, version of its pending retry)
+        self._retries: Dict[int, Tuple[int, int]] = {}
+        self._version = 0
+        # Tickets tracked while a resync load is in flight; the newer tracked state beats the snapshot
+        self._touched: Optional[Set[int]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        self._escalate: Optional[EscalateCallback] = None
+        self._load: Optional[LoadCallback] = None
+
+    def start(self, escalate: EscalateCallback, load: LoadCallback) -> None:
+        self._escalate = escalate
+        self._load = load
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        logger.info("Escalation timer queue started")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        self._loop = None
+
+    def track(self, rows: Iterable[Mapping[str, Any]]) -> None:
+        entries = [
+            (
+                row["id"],
+                self._instants(row["created_at"], row["resolution_sla_deadline"])
+                if row["status"] == TicketStatus.OPEN else None,
+                row.get("escalation_level"),
+            )
+            for row in rows
+        ]
+        self._call_soon(self._apply, entries)
+
+    async def resync(self) -> None:
+        if self._load is None:
+            return
+        self._touched = set()
+        try:
+            rows = await self._load()
+            touched = self._touched
+        finally:
+            self._touched = None
+        entries = [
+            (ticket_id, self._instants(created_at, deadline), level)
+            for ticket_id, created_at, deadline, level in rows
+        ]
+        self._merge(entries, touched)
+        logger.info(f"Escalation timer queue resynced with {len(entries)} open tickets, {len(touched)} tracked meanwhile")
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "tracked_tickets": len(self._deadlines),
+            "scheduled_timers": len(self._heap),
+            "pending_retries": len(self._retries),
+        }
+
+    def _instants(self, created_at: datetime, deadline: Optional[datetime]) -> Optional[Tuple[float, float]]:
+        if deadline is None:
+            return None
+        created, breach_at = _epoch(created_at), _epoch(deadline)
+        alert_at = created + (breach_at - created) * self.alert_fraction
+        return alert_at + FIRE_GRACE_SECONDS, breach_at + FIRE_GRACE_SECONDS
+
+    def _call_soon(self, callback: Callable[..., None], *args: Any) -> None:
+        if self._loop is None:
+            return
+        self._loop.call_soon_threadsafe(callback, *args)
+
+    def _apply(self, entries: List[Tuple[int, Instants, Optional[EscalationLevel]]]) -> None:
+        for ticket_id, instants, level in entries:
+            if self._touched is not None:
+                self._touched.add(ticket_id)
+            self._schedule(ticket_id, instants, level)
+        self._wake()
+
+    def _merge(self, entries: List[Tuple[int, Instants, Optional[EscalationLevel]]], touched: Set[int]) -> None:
+        loaded: Set[int] = set()
+        for ticket_id, instants, level in entries:
+            loaded.add(ticket_id)
+            if ticket_id not in touched:
+                self._schedule(ticket_id, instants, level)
+        # Closed or breached since they were tracked, unless tracking after the snapshot says otherwise
+        for ticket_id in [ticket_id for ticket_id in self._deadlines if ticket_id not in loaded and ticket_id not in touched]:
+            del self._deadlines[ticket_id]
+        self._wake()
+
+    def _schedule(self, ticket_id: int, instants: Instants, level: Optional[EscalationLevel]) -> None:
+        if instants is None or level == EscalationLevel.BREACH:
+            self._deadlines.pop(ticket_id, None)
+            self._retries.pop(ticket_id, None)
+            return
+
+        alert_at, breach_at = instants
+        current = self._deadlines.get(ticket_id)
+        # Same deadlines as already scheduled: keep the timers, so past instants are not fired again
+        if current is not None and current[:2] == instants:
+            return
+
+        self._version += 1
+        self._deadlines[ticket_id] = (alert_at, breach_at, self._version)
+        # A ticket already at ALERT only has its breach left
+        if level == EscalationLevel.ALERT:
+            heapq.heappush(self._heap, (breach_at, ticket_id, self._version, BREACH))
+        else:
+            heapq.heappush(self._heap, (alert_at, ticket_id, self._version, ALERT))
+
+    def _retry_later(self, ticket_ids: List[int]) -> None:
+        now = time.time()
+        for ticket_id in ticket_ids:
+            attempts = self._retries.get(ticket_id, (0, 0))[0] + 1
+            delay = min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * 2 ** (attempts - 1))
+            self._version += 1
+            self._retries[ticket_id] = (attempts, self._version)
+            heapq.heappush(self._heap, (now + delay, ticket_id, self._version, RETRY))
+
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _pop_due(self, now: float) -> List[int]:
+        due: List[int] = []
+        while self._heap and self._heap[0][0] <= now:
+            _, ticket_id, version, kind = heapq.heappop(self._heap)
+            if kind == RETRY:
+                retry = self._retries.get(ticket_id)
+                if retry is not None and retry[1] == version:
+                    due.append(ticket_id)
+                continue
+
+            current = self._deadlines.get(ticket_id)
+            if current is None or current[2] != version:
+                continue
+
+            due.append(ticket_id)
+            if kind == BREACH:
+                del self._deadlines[ticket_id]
+            else:
+                heapq.heappush(self._heap, (current[1], ticket_id, version, BREACH))
+        # The same ticket may be due for both a retry and its next instant
+        return list(dict.fromkeys(due))
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            now = time.time()
+            due = self._pop_due(now)
+            if due:
+                await self._fire(due)
+                continue
+
+            timeout = self._heap[0][0] - now if self._heap else None
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _fire(self, ticket_ids: List[int]) -> None:
+        if self._escalate is None:
+            return
+        try:
+            await self._escalate(ticket_ids)
+        except Exception as e:
+            logger.exception(f"Timer escalation failed for {len(ticket_ids)} tickets, retrying with backoff: {e}")
+            self._retry_later(ticket_ids)
+            return
+        for ticket_id in ticket_ids:
+            self._retries.pop(ticket_id, None)
+
+escalation_timers = EscalationTimerQueue(settings.ESCALATION_ALERT_REMAINING_PERCENT)
@@ -0,0 +1,110 @@
+import asyncio
+import logging
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+from uuid import uuid4
+
+from starlette.concurrency import run_in_threadpool
+
+from app.config.settings import settings
+from app.dto.ingestion_job_response import IngestionJobResponse, IngestionJobStatus
+from app.exceptions.exceptions import DBException, QueueFullException, UnexpectedException, UseCaseException
+from app.dto.ticket_ingest import TicketIngest
+from app.services.ticket_service import TicketService
+
+logger = logging.getLogger(__name__)
+
+class IngestionQueue:
+    """Bounded job queue drained by a fixed pool of background ingestion workers."""
+
+    def __init__(
+        self,
+        ticket_service: TicketService,
+        maxsize: int,
+        workers: int,
+        micro_batch_size: int,
+        job_retention: int,
+    ):
+        self.ticket_service = ticket_service
+        self.workers = workers
+        self.micro_batch_size = micro_batch_size
+        self.job_retention = job_retention
+        self._queue: asyncio.Queue[Tuple[str, List[TicketIngest]]] = asyncio.Queue(maxsize=maxsize)
+        self._jobs: OrderedDict[str, IngestionJobResponse] = OrderedDict()
+        self._tasks: List[asyncio.Task[None]] = []
+
+    def start(self) -> None:
+        for index in range(self.workers):
+            self._tasks.append(asyncio.create_task(self._worker(index)))
+        logger.info(f"Started {self.workers} ingestion workers")
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    def submit(self, tickets: List[TicketIngest]) -> IngestionJobResponse:
+        job = IngestionJobResponse(
+            job_id=str(uuid4()),
+            received=len(tickets),
+            created_at=datetime.now(timezone.utc),
+        )
+        try:
+            self._queue.put_nowait((job.job_id, tickets))
+        except asyncio.QueueFull:
+            logger.warning(f"Ingestion queue full, rejecting batch of {len(tickets)} tickets")
+            raise QueueFullException("Ingestion queue is full, retry later")
+
+        self._jobs[job.job_id] = job
+        self._evict_finished_jobs()
+        logger.info(f"Enqueued ingestion job {job.job_id} with {len(tickets)} tickets")
+        return job
+
+    def get(self, job_id: str) -> Optional[IngestionJobResponse]:
+        return self._jobs.get(job_id)
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            job_id, tickets = await self._queue.get()
+            try:
+                await self._run_job(self._jobs[job_id], tickets)
+            finally:
+                self._queue.task_done()
+
+    async def _run_job(self, job: IngestionJobResponse, tickets: List[TicketIngest]) -> None:
+        job.status = IngestionJobStatus.RUNNING
+        for start in range(0, len(tickets), self.micro_batch_size):
+            batch = tickets[start:start + self.micro_batch_size]
+            try:
+                counts = await run_in_threadpool(self.ticket_service.process_tickets, batch)
+                job.inserted += counts.inserted
+                job.updated += counts.updated
+                job.skipped += counts.skipped
+                job.failed.extend(counts.failed)
+            except (DBException, UseCaseException, UnexpectedException) as batch_error:
+                logger.warning(f"Ingestion job {job.job_id} batch at offset {start} failed: {batch_error}")
+                job.errors.append(f"tickets {start}-{start + len(batch) - 1}: {batch_error}")
+            job.processed += len(batch)
+
+        job.status = IngestionJobStatus.FAILED if job.errors or job.failed else IngestionJobStatus.COMPLETED
+        job.finished_at = datetime.now(timezone.utc)
+        logger.info(f"Ingestion job {job.job_id} finished with status {job.status}")
+
+    def _evict_finished_jobs(self) -> None:
+        excess = len(self._jobs) - self.job_retention
+        for job_id in list(self._jobs):
+            if excess <= 0:
+                break
+            if self._jobs[job_id].finished_at is not None:
+                del self._jobs[job_id]
+                excess -= 1
+
+ingestion_queue = IngestionQueue(
+    TicketService(),
+    maxsize=settings.INGESTION_QUEUE_MAXSIZE,
+    workers=settings.INGESTION_WORKERS,
+    micro_batch_size=settings.INGESTION_CHUNK_SIZE,
+    job_retention=settings.INGESTION_JOB_RETENTION,
+)
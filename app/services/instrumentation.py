@@ -0,0 +1,181 @@
+import asyncio
+import itertools
+import logging
+import threading
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from typing import Any, ContextManager, Dict, Iterator, List, Optional, Set
+
+import structlog
+import yappi  # type: ignore
+
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+class RunRecorder:
+    """Stage timings, counters and latency samples collected during one ingestion or escalation run."""
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self.started_at = datetime.now(timezone.utc)
+        self._start = perf_counter()
+        self.stages: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+        self.latencies: Dict[str, List[float]] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            # Stages repeated per chunk or batch accumulate into one total
+            self.stages[name] = self.stages.get(name, 0.0) + perf_counter() - start
+
+    def increment(self, name: str, value: int = 1) -> None:
+        self.counts[name] = self.counts.get(name, 0) + value
+
+    def observe(self, name: str, seconds: float) -> None:
+        self.latencies.setdefault(name, []).append(seconds)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "started_at": self.started_at.isoformat(),
+            "duration": perf_counter() - self._start,
+            "stages": dict(self.stages),
+            "counts": dict(self.counts),
+            "latencies": {name: _describe(samples) for name, samples in self.latencies.items()},
+        }
+
+def _describe(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "p50": ordered[len(ordered) // 2],
+        "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "max": ordered[-1],
+    }
+
+_current_run: ContextVar[Optional[RunRecorder]] = ContextVar("current_run", default=None)
+
+# Tag of the profiled run owning the current context; 0 for everything else on the loop or in other threads.
+# Tasks the run spawns inherit it, coroutines interleaved from other tasks do not.
+_profile_tag: ContextVar[int] = ContextVar("profile_tag", default=0)
+
+class Instrumentation:
+    """Emits one summary record per run and optionally profiles the next N runs of a kind.
+
+    Profiles are taken with yappi's coroutine-aware wall clock and filtered by context tag, so a
+    profile holds only the run's own task even though other coroutines share the event loop.
+    """
+
+    def __init__(self, profile_dir: str, escalation_profile_runs: int):
+        self.profile_dir = Path(profile_dir)
+        self._pending_profiles: Dict[str, int] = {"escalation": escalation_profile_runs}
+        self._profiling = False
+        self._runs: Dict[str, int] = {}
+        self._last: Dict[str, Dict[str, Any]] = {}
+        self._last_profile: Optional[str] = None
+        self._lock = threading.Lock()
+        self._tags = itertools.count(1)
+        self._writes: Set["asyncio.Task[None]"] = set()
+        yappi.set_tag_callback(_profile_tag.get)
+
+    @contextmanager
+    def run(self, kind: str) -> Iterator[RunRecorder]:
+        recorder = RunRecorder(kind)
+        token = _current_run.set(recorder)
+        tag = self._claim_profiler(kind)
+        tag_token = _profile_tag.set(tag) if tag else None
+        try:
+            yield recorder
+        finally:
+            if tag_token is not None:
+                _profile_tag.reset(tag_token)
+                yappi.stop()
+                self._write_profile(tag, kind)
+            _current_run.reset(token)
+            self._record(recorder)
+
+    def profile_next(self, kind: str, runs: int) -> int:
+        with self._lock:
+            self._pending_profiles[kind] = runs
+        logger.info(f"Profiling the next {runs} {kind} runs")
+        return runs
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "runs": dict(self._runs),
+                "last": dict(self._last),
+                "pending_profiles": dict(self._pending_profiles),
+                "last_profile": self._last_profile,
+            }
+
+    def _claim_profiler(self, kind: str) -> int:
+        with self._lock:
+            # yappi is process-wide; overlapping runs go unprofiled
+            if self._profiling or self._pending_profiles.get(kind, 0) <= 0:
+                return 0
+            self._pending_profiles[kind] -= 1
+            self._profiling = True
+
+        yappi.set_clock_type("wall")
+        yappi.start()
+        return next(self._tags)
+
+    def _write_profile(self, tag: int, kind: str) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Ingestion runs in a worker thread, where writing inline blocks nobody else
+            self._dump_profile(tag, kind)
+            return
+        task = loop.create_task(asyncio.to_thread(self._dump_profile, tag, kind))
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    def _dump_profile(self, tag: int, kind: str) -> None:
+        path = self.profile_dir / f"{kind}-{datetime.now(timezone.utc):%Y%m%dT%H%M%S%f}.prof"
+        try:
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+            yappi.get_func_stats(filter={"tag": tag}).save(str(path), type="pstat")
+            logger.info(f"Wrote {kind} run profile to {path}")
+        except OSError as e:
+            logger.error(f"Failed to write {kind} run profile to {path}: {e}")
+        finally:
+            yappi.clear_stats()
+        with self._lock:
+            self._profiling = False
+            self._last_profile = str(path)
+
+    def _record(self, recorder: RunRecorder) -> None:
+        summary = recorder.summary()
+        with self._lock:
+            self._runs[recorder.kind] = self._runs.get(recorder.kind, 0) + 1
+            self._last[recorder.kind] = summary
+        structlog.get_logger().info("run_completed", operation=f"{recorder.kind}_run", **summary)
+
+def stage(name: str) -> ContextManager[None]:
+    recorder = _current_run.get()
+    return recorder.stage(name) if recorder is not None else nullcontext()
+
+def increment(name: str, value: int = 1) -> None:
+    recorder = _current_run.get()
+    if recorder is not None:
+        recorder.increment(name, value)
+
+def observe(name: str, seconds: float) -> None:
+    recorder = _current_run.get()
+    if recorder is not None:
+        recorder.observe(name, seconds)
+
+instrumentation = Instrumentation(
+    profile_dir=settings.PROFILE_OUTPUT_DIR,
+    escalation_profile_runs=settings.ESCALATION_PROFILE_RUNS,
+)
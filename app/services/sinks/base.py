@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+from app.config.sla_config import SinkConfig
+from app.dto.alert_event import AlertEvent
+
+class AlertSink(ABC):
+    """A destination for escalation events; `deliver` is called from the sink's own worker pool.
+
+    Raising fails the whole batch; raise PartialDeliveryException to retry only some of its events.
+    """
+
+    def __init__(self, config: SinkConfig):
+        self.config = config
+
+    @property
+    def name(self) -> str:
+        return self.config.name
+
+    @property
+    def linger_seconds(self) -> float:
+        """How long pending events may wait so they go out together; 0 delivers as soon as woken."""
+        return self.config.linger_seconds
+
+    @abstractmethod
+    async def deliver(self, events: Sequence[AlertEvent]) -> None:
+        ...
@@ -0,0 +1,240 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+from time import monotonic, perf_counter
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Type
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.config.settings import settings
+from app.config.sla_config import SinkConfig
+from app.db.db import async_engine
+from app.dto.alert_event import AlertEvent
+from app.exceptions.exceptions import PartialDeliveryException
+from app.models.escalation_outbox import EscalationOutbox
+from app.repositories.escalation_outbox_repository import EscalationOutboxRepository
+from app.services.instrumentation import increment, instrumentation, stage
+from app.services.sinks.base import AlertSink
+from app.services.sinks.slack_sink import SlackSink
+from app.services.sinks.webhook_sink import WebhookSink
+from app.services.sinks.websocket_sink import WebSocketSink
+
+logger = logging.getLogger(__name__)
+
+SINK_TYPES: Dict[str, Type[AlertSink]] = {
+    "slack": SlackSink,
+    "webhook": WebhookSink,
+    "websocket": WebSocketSink,
+}
+
+class CircuitBreaker:
+    """Opens after `failure_threshold` consecutive failures and lets one trial through after `reset_seconds`."""
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> str:
+        if self.failures < self.failure_threshold:
+            return "closed"
+        return "half_open" if self.retry_in() == 0 else "open"
+
+    def retry_in(self) -> float:
+        if self.failures < self.failure_threshold:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_seconds - monotonic())
+
+    def record_success(self) -> None:
+        self.failures = 0
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self._opened_at = monotonic()
+
+class SinkChannel:
+    """One sink's workers and circuit breaker, draining that sink's pending outbox deliveries.
+
+    Delivery state lives in the database: a row is marked delivered for this sink only after `deliver`
+    succeeded, failures are retried with backoff, and anything pending survives restarts. A slow or
+    broken sink leaves its own rows pending without holding up any other sink.
+
+    Rows are leased rather than locked while `deliver` runs, so a batch that outlives `lease_seconds`
+    (or a worker that dies mid-batch) is claimed again and delivered twice rather than lost.
+    """
+
+    def __init__(self, sink: AlertSink, poll_seconds: float, max_attempts: int, lease_seconds: float):
+        self.sink = sink
+        self.config = sink.config
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+        self.breaker = CircuitBreaker(self.config.failure_threshold, self.config.reset_seconds)
+        # A lingering sink (Slack digests) ignores wake-ups and drains once per window
+        self.linger_seconds = sink.linger_seconds
+        self.poll_seconds = max(poll_seconds, self.linger_seconds)
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task[None]] = []
+        self.delivered = 0
+        self.failed = 0
+        self._latency_total = 0.0
+        self._deliveries = 0
+
+    def start(self) -> None:
+        self._wakeup = asyncio.Event()
+        for _ in range(self.config.workers):
+            self._tasks.append(asyncio.create_task(self._worker()))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    def wake(self) -> None:
+        if self._wakeup is not None and not self.linger_seconds:
+            self._wakeup.set()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "type": self.config.type,
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "circuit": self.breaker.state,
+            "avg_latency": self._latency_total / self._deliveries if self._deliveries else 0.0,
+        }
+
+    async def _worker(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            # While the breaker is open, events stay pending in the database instead of hammering a dead endpoint
+            delay = self.breaker.retry_in()
+            if delay:
+                await asyncio.sleep(delay)
+            try:
+                claimed = await self.drain()
+            except Exception as e:
+                logger.exception(f"Alert sink {self.sink.name} drain failed: {e}")
+                claimed = 0
+
+            # A full batch means more is probably waiting; otherwise sleep until woken or the next poll
+            if claimed < self.config.batch_size:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def drain(self) -> int:
+        with instrumentation.run("outbox"):
+            # Claim under a lease and commit, so no transaction stays open while the sink is slow
+            async with AsyncSession(async_engine) as session:
+                with stage("claim"):
+                    entries = await EscalationOutboxRepository(session).claim_pending(
+                        self.sink.name, self.config.batch_size, self.max_attempts, self.lease_seconds
+                    )
+                    batch = [_to_event(entry) for entry in entries]
+                    await session.commit()
+            if not batch:
+                return 0
+            increment("claimed", len(batch))
+
+            failed, error = await self._deliver(batch)
+            ids = [event.seq for event in batch]
+            with stage("mark"):
+                async with AsyncSession(async_engine) as session:
+                    repo = EscalationOutboxRepository(session)
+                    await repo.mark_delivered(self.sink.name, [i for i in ids if i not in failed], datetime.now(timezone.utc))
+                    await repo.mark_failed(
+                        self.sink.name,
+                        [i for i in ids if i in failed],
+                        error,
+                        settings.OUTBOX_RETRY_BASE_SECONDS,
+                        settings.OUTBOX_RETRY_MAX_SECONDS,
+                    )
+                    await session.commit()
+            increment("delivered", len(ids) - len(failed))
+            increment("failed", len(failed))
+            return len(batch)
+
+    async def _deliver(self, batch: List[AlertEvent]) -> Tuple[Set[int], str]:
+        """Returns the seqs that failed (to retry) and the error they failed with."""
+        start = perf_counter()
+        try:
+            with stage("deliver"):
+                await self.sink.deliver(batch)
+        except PartialDeliveryException as e:
+            failed, error = e.failed, str(e)
+        except Exception as e:
+            failed, error = {event.seq for event in batch}, repr(e)
+        else:
+            failed, error = set(), ""
+        finally:
+            self._latency_total += perf_counter() - start
+            self._deliveries += 1
+
+        self.delivered += len(batch) - len(failed)
+        self.failed += len(failed)
+        if failed:
+            self.breaker.record_failure()
+            logger.warning(
+                f"Alert sink {self.sink.name} failed to deliver {len(failed)} of {len(batch)} events, "
+                f"will retry (circuit {self.breaker.state}): {error}"
+            )
+        else:
+            self.breaker.record_success()
+        return failed, error
+
+def _to_event(entry: EscalationOutbox) -> AlertEvent:
+    return AlertEvent(
+        seq=entry.id,
+        event=entry.event,
+        ticket_id=entry.ticket_id,
+        remaining_percent=entry.remaining_percent,
+        priority=entry.priority,
+        customer_tier=entry.customer_tier,
+        created_at=entry.created_at,
+    )
+
+class AlertSinkRegistry:
+    """The configured alert sinks, each draining its own outbox deliveries independently of the others."""
+
+    def __init__(self, poll_seconds: float, max_attempts: int, lease_seconds: float):
+        self.poll_seconds = poll_seconds
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+        self._channels: Dict[str, SinkChannel] = {}
+
+    def configure(self, configs: Sequence[SinkConfig]) -> None:
+        self._channels = {
+            config.name: SinkChannel(SINK_TYPES[config.type](config), self.poll_seconds, self.max_attempts, self.lease_seconds)
+            for config in configs
+            if config.enabled
+        }
+        logger.info(f"Configured alert sinks: {', '.join(self._channels) or 'none'}")
+
+    def names(self) -> List[str]:
+        return list(self._channels)
+
+    def start(self) -> None:
+        for channel in self._channels.values():
+            channel.start()
+
+    async def stop(self) -> None:
+        for channel in self._channels.values():
+            await channel.stop()
+
+    def wake(self) -> None:
+        for channel in self._channels.values():
+            channel.wake()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: channel.stats() for name, channel in self._channels.items()}
+
+alert_sinks = AlertSinkRegistry(
+    poll_seconds=settings.OUTBOX_POLL_SECONDS,
+    max_attempts=settings.OUTBOX_MAX_ATTEMPTS,
+    lease_seconds=settings.OUTBOX_LEASE_SECONDS,
+)
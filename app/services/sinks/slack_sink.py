@@ -0,0 +1,40 @@
+import asyncio
+from typing import Sequence
+
+from app.config.settings import settings
+from app.config.sla_config import SinkConfig
+from app.dto.alert_event import AlertEvent
+from app.exceptions.exceptions import PartialDeliveryException
+from app.services.sinks.base import AlertSink
+from app.services.webhooks.slack_webhook_service import SlackWebhook
+
+class SlackSink(AlertSink):
+    def __init__(self, config: SinkConfig):
+        super().__init__(config)
+        self.slack_webhook = SlackWebhook(base_url=config.url, timeout=config.timeout_seconds)
+
+    @property
+    def linger_seconds(self) -> float:
+        # The digest window paces this sink's channel only; other sinks still deliver on wake-up
+        if settings.SLACK_ALERT_MODE == "digest":
+            return max(super().linger_seconds, settings.SLACK_DIGEST_WINDOW_SECONDS)
+        return super().linger_seconds
+
+    async def deliver(self, events: Sequence[AlertEvent]) -> None:
+        if settings.SLACK_ALERT_MODE == "digest":
+            await self.slack_webhook.send_digest([
+                (event.ticket_id, event.event, event.remaining_percent) for event in events
+            ])
+            return
+
+        results = await asyncio.gather(
+            *(self.slack_webhook.send_alert(event.ticket_id, event.remaining_percent) for event in events),
+            return_exceptions=True,
+        )
+        # Only the tickets whose post failed are retried, so the others are not alerted twice
+        failed = [(event, result) for event, result in zip(events, results) if isinstance(result, BaseException)]
+        if failed:
+            raise PartialDeliveryException(
+                f"{len(failed)} of {len(events)} Slack alerts failed: {failed[0][1]!r}",
+                [event.seq for event, _ in failed],
+            )
@@ -0,0 +1,25 @@
+from typing import Sequence
+
+from app.config.sla_config import SinkConfig
+from app.dto.alert_event import AlertEvent
+from app.services.sinks.base import AlertSink
+from app.services.webhooks.generic_webhook import WebhookService
+
+class WebhookSink(AlertSink):
+    """POSTs each batch of events as JSON to an arbitrary endpoint (PagerDuty-style or internal services)."""
+
+    def __init__(self, config: SinkConfig):
+        super().__init__(config)
+        if not config.url:
+            raise ValueError(f"Webhook sink {config.name} needs a url")
+        self.webhook = WebhookService(
+            base_url=config.url,
+            default_headers={"Content-Type": "application/json", **config.headers},
+            timeout=config.timeout_seconds,
+        )
+
+    async def deliver(self, events: Sequence[AlertEvent]) -> None:
+        await self.webhook.post(
+            self.config.endpoint,
+            {"events": [event.model_dump(mode="json") for event in events]},
+        )
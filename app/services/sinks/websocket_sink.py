@@ -0,0 +1,11 @@
+from typing import Sequence
+
+from app.dto.alert_event import AlertEvent
+from app.services.sinks.base import AlertSink
+from app.websocket.backbone import alert_backbone
+
+class WebSocketSink(AlertSink):
+    """Publishes each batch to the alert backbone, which routes it to subscribed dashboards in every process."""
+
+    async def deliver(self, events: Sequence[AlertEvent]) -> None:
+        await alert_backbone.publish(events)
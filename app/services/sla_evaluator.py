@@ -0,0 +1,46 @@
+from typing import Any, NamedTuple, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from app.models.ticket import EscalationLevel
+
+LEVEL_CODES = {
+    None: 0,
+    EscalationLevel.ALERT: 1,
+    EscalationLevel.BREACH: 2,
+}
+
+class SLAEvaluation(NamedTuple):
+    remaining_percent: npt.NDArray[np.float64]
+    alert: npt.NDArray[np.intp]
+    breach: npt.NDArray[np.intp]
+
+def evaluate_sla_batch(
+    rows: Sequence[Any],
+    now: float,
+    alert_remaining_percent: float,
+) -> SLAEvaluation:
+    """Evaluate a whole candidate set against one clock reading.
+
+    `rows` expose `created_epoch`, `deadline_epoch` and `escalation_level`. Returns the remaining
+    percent per row plus the indices of rows that must move to ALERT and to BREACH.
+    """
+    count = len(rows)
+    created = np.fromiter((row.created_epoch for row in rows), dtype=np.float64, count=count)
+    deadlines = np.fromiter((row.deadline_epoch for row in rows), dtype=np.float64, count=count)
+    levels = np.fromiter((LEVEL_CODES[row.escalation_level] for row in rows), dtype=np.int8, count=count)
+
+    window = deadlines - created
+    with np.errstate(divide="ignore", invalid="ignore"):
+        remaining_percent = (deadlines - now) / window * 100.0
+
+    valid = window > 0
+    breach = valid & (remaining_percent <= 0) & (levels != LEVEL_CODES[EscalationLevel.BREACH])
+    alert = (
+        valid
+        & (remaining_percent > 0)
+        & (remaining_percent <= alert_remaining_percent)
+        & (levels == LEVEL_CODES[None])
+    )
+    return SLAEvaluation(remaining_percent, np.flatnonzero(alert), np.flatnonzero(breach))
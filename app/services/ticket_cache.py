@@ -0,0 +1,64 @@
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from time import monotonic
+from typing import Dict, Iterable, Mapping, Tuple
+
+from app.config.settings import settings
+from app.utils.utils import update_fingerprint
+
+class TicketChangeCache:
+    """Bounded LRU/TTL map of ticket id to the last committed updated_at fingerprint."""
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[int, Tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def is_unchanged(self, ticket_id: int, updated_at: datetime) -> bool:
+        with self._lock:
+            entry = self._entries.get(ticket_id)
+            if entry is not None and entry[1] < monotonic():
+                del self._entries[ticket_id]
+                entry = None
+
+            if entry is not None and entry[0] == update_fingerprint(updated_at):
+                self._entries.move_to_end(ticket_id)
+                self.hits += 1
+                return True
+
+            self.misses += 1
+            return False
+
+    def update(self, versions: Mapping[int, datetime]) -> None:
+        expires_at = monotonic() + self.ttl_seconds
+        with self._lock:
+            for ticket_id, updated_at in versions.items():
+                self._entries[ticket_id] = (update_fingerprint(updated_at), expires_at)
+                self._entries.move_to_end(ticket_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, ticket_ids: Iterable[int]) -> None:
+        with self._lock:
+            for ticket_id in ticket_ids:
+                self._entries.pop(ticket_id, None)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+ticket_cache = TicketChangeCache(
+    maxsize=settings.TICKET_CACHE_MAXSIZE,
+    ttl_seconds=settings.TICKET_CACHE_TTL_SECONDS,
+)
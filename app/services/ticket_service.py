@@ -1,21 +1,42 @@
-import json
 from asyncio.log import logger
-from typing import List, Optional, Sequence, Tuple
+from typing import Any, AsyncIterable, Collection, Dict, List, Optional, Sequence, Set, Tuple
 from datetime import datetime, timezone
 
 from sqlmodel import Session
-from sqlalchemy.exc import SQLAlchemyError
-
-from app.db.db import engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import Row, RowMapping
+from sqlalchemy.exc import DataError, IntegrityError, SQLAlchemyError
+
+from app.config.settings import settings
+from app.config.sla_config import SLAConfig, SLAMatrix
+from app.db.db import async_engine, engine
+from app.dto.ingestion_response import (
+    ChunkIngestionResponse,
+    FailedTicket,
+    IngestionCounts,
+    IngestionResponse,
+    StreamIngestionResponse,
+)
+from app.dto.ticket_ingest import TicketIngest
 from app.dto.ticket_response import TicketResponse
 from app.exceptions.exceptions import DBException, NotFoundException, UnexpectedException, UseCaseException
-from app.models.ticket import EscalationLevel, Ticket, TicketStatus
+from app.models.ticket import CustomerTier, EscalationLevel, Priority, Ticket, TicketStatus
+from app.repositories.escalation_outbox_repository import EscalationOutboxRepository
+from app.repositories.ticket_escalation_repository import TicketEscalationRepository
 from app.repositories.ticket_history_repository import TicketHistoryRepository
 from app.repositories.ticket_repository import TicketRepository
-from app.services.webhooks.slack_webhook_service import SlackWebhook
-from app.utils.utils import calculate_remaining_seconds, to_datetime
-from app.websocket.manager import manager
-
+from app.repositories.ticket_status_count_repository import TicketStatusCountRepository
+from app.services.escalation_timer import escalation_timers
+from app.services.instrumentation import increment, instrumentation, stage
+from app.services.sinks.registry import alert_sinks
+from app.services.sla_evaluator import SLAEvaluation, evaluate_sla_batch
+from app.services.ticket_cache import ticket_cache
+from app.utils.cursor import decode_cursor, encode_cursor
+from app.utils.utils import calculate_remaining_seconds, describe_db_error, update_fingerprint
+
+# Errors caused by one row's data; only these are worth isolating row by row
+ROW_LEVEL_ERRORS = (IntegrityError, DataError)
 
 class TicketService:
     def __init__(self):
@@ -48,119 +69,342 @@ class TicketService:
                 logger.exception(f"Unexpected error fetching ticket {ticket_id}: {general_error}")
                 raise UnexpectedException(f"Unexpected error fetching ticket: {general_error}")
 
-    def process_tickets(self, tickets: List[Ticket]) -> None:
-        logger.info(f"Starting to process batch of {len(tickets)} tickets")
-        try:
-            with Session(engine) as session:
-                repo = TicketRepository(session)
-
+    def process_tickets(self, tickets: List[TicketIngest]) -> IngestionResponse:
+        with instrumentation.run("ingestion") as run:
+            logger.info(f"Starting to process batch of {len(tickets)} tickets")
+            try:
                 for ticket in tickets:
-                    try:
-                        logger.info(f"Processing ticket id={ticket.id}")
-                        self._process_single_ticket(ticket, repo, session)
-                    except SQLAlchemyError as db_err:
-                        logger.exception(f"Database error processing ticket {ticket.id}: {db_err}")
-                        session.rollback()
-                        raise DBException("Error processing tickets")
+                    self._validate_ticket_id(ticket)
+
+                result = IngestionResponse(received=len(tickets))
+                chunk_size = settings.INGESTION_CHUNK_SIZE
+                with Session(engine) as session:
+                    for start in range(0, len(tickets), chunk_size):
+                        self._process_chunk(tickets[start:start + chunk_size], session, result)
+                        session.expunge_all()
+
+                run.increment("received", result.received)
+                run.increment("inserted", result.inserted)
+                run.increment("updated", result.updated)
+                run.increment("skipped", result.skipped)
+                run.increment("failed", len(result.failed))
+                logger.info(
+                    f"Batch processed: inserted={result.inserted}, updated={result.updated}, "
+                    f"skipped={result.skipped}, failed={len(result.failed)}"
+                )
+                return result
 
-                session.commit()
-                logger.info("All tickets processed and session committed")
+            except SQLAlchemyError as db_err:
+                logger.exception(f"Database error processing batch: {db_err}")
+                raise DBException("Error processing tickets")
+            except (DBException, UseCaseException):
+                logger.warning("Process halted due to known exception")
+                raise
+            except Exception as general_error:
+                logger.exception(f"Unexpected error processing tickets: {general_error}")
+                raise UnexpectedException(f"Unexpected error processing tickets: {general_error}")
 
-        except (DBException, UseCaseException):
-            logger.warning("Process halted due to known exception")
+    def _process_chunk(self, chunk: List[TicketIngest], session: Session, result: IngestionResponse) -> None:
+        try:
+            try:
+                counts, versions, written = self._upsert_tickets(chunk, session)
+                with stage("commit"):
+                    session.commit()
+            except ROW_LEVEL_ERRORS as db_err:
+                logger.warning(f"Chunk of {len(chunk)} tickets failed, isolating bad rows: {db_err}")
+                session.rollback()
+                ticket_cache.invalidate(ticket.id for ticket in chunk)
+                with stage("isolate_failures"):
+                    counts, versions, written = self._isolate_failed_tickets(chunk, session)
+                    session.commit()
+        except SQLAlchemyError:
+            # Connection loss, lock timeouts and the like are not the data's fault: fail the request instead
+            session.rollback()
+            ticket_cache.invalidate(ticket.id for ticket in chunk)
             raise
-        except Exception as general_error:
-            logger.exception(f"Unexpected error processing tickets: {general_error}")
-            raise UnexpectedException(f"Unexpected error processing tickets: {general_error}")
 
-    def _process_single_ticket(
+        ticket_cache.update(versions)
+        escalation_timers.track(written)
+        self._accumulate_counts(result, counts)
+
+    def _isolate_failed_tickets(
+        self, chunk: List[TicketIngest], session: Session
+    ) -> Tuple[IngestionResponse, Dict[int, datetime], List[Dict[str, Any]]]:
+        counts = IngestionResponse()
+        versions: Dict[int, datetime] = {}
+        written: List[Dict[str, Any]] = []
+        for ticket in chunk:
+            try:
+                with session.begin_nested():
+                    row_counts, row_versions, row_written = self._upsert_tickets([ticket], session)
+            except ROW_LEVEL_ERRORS as row_err:
+                logger.warning(f"Ticket {ticket.id} rejected: {row_err}")
+                counts.failed.append(FailedTicket(id=ticket.id, error=describe_db_error(row_err)))
+                versions.pop(ticket.id, None)
+                continue
+
+            self._accumulate_counts(counts, row_counts)
+            versions.update(row_versions)
+            written.extend(row_written)
+        return counts, versions, written
+
+    def _accumulate_counts(self, target: IngestionCounts, counts: IngestionCounts) -> None:
+        target.inserted += counts.inserted
+        target.updated += counts.updated
+        target.skipped += counts.skipped
+        target.failed.extend(counts.failed)
+
+    async def process_ticket_stream(
         self,
-        ticket: Ticket,
-        repo: TicketRepository,
-        session: Session
+        lines: AsyncIterable[Tuple[int, bytes]],
+        chunk_size: int,
+    ) -> StreamIngestionResponse:
+        logger.info(f"Starting streamed ingestion with chunk size {chunk_size}")
+        response = StreamIngestionResponse()
+        batch: List[TicketIngest] = []
+        errors: List[str] = []
+        first_line: Optional[int] = None
+        last_line = 0
+
+        async for line_no, line in lines:
+            if first_line is None:
+                first_line = line_no
+            last_line = line_no
+
+            try:
+                batch.append(TicketIngest.model_validate_json(line))
+            except ValueError as parse_error:
+                logger.warning(f"Invalid ticket on line {line_no}: {parse_error}")
+                errors.append(f"line {line_no}: {parse_error}")
+
+            if len(batch) >= chunk_size:
+                response.chunks.append(await self._process_stream_chunk(
+                    len(response.chunks) + 1, first_line, last_line, batch, errors
+                ))
+                batch, errors, first_line = [], [], None
+
+        if first_line is not None:
+            response.chunks.append(await self._process_stream_chunk(
+                len(response.chunks) + 1, first_line, last_line, batch, errors
+            ))
+
+        logger.info(f"Streamed ingestion finished in {len(response.chunks)} chunks")
+        return response
+
+    async def _process_stream_chunk(
+        self,
+        chunk: int,
+        first_line: int,
+        last_line: int,
+        tickets: List[TicketIngest],
+        errors: List[str],
+    ) -> ChunkIngestionResponse:
+        result = ChunkIngestionResponse(
+            chunk=chunk,
+            first_line=first_line,
+            last_line=last_line,
+            received=len(tickets) + len(errors),
+            errors=errors,
+        )
+        if not tickets:
+            return result
+
+        try:
+            counts = await run_in_threadpool(self.process_tickets, tickets)
+        except (DBException, UseCaseException, UnexpectedException) as chunk_error:
+            logger.warning(f"Chunk {chunk} (lines {first_line}-{last_line}) failed: {chunk_error}")
+            result.errors.append(str(chunk_error))
+            return result
+
+        self._accumulate_counts(result, counts)
+        result.committed = True
+        return result
+
+    def _upsert_tickets(
+        self, tickets: List[TicketIngest], session: Session
+    ) -> Tuple[IngestionResponse, Dict[int, datetime], List[Dict[str, Any]]]:
+        repo = TicketRepository(session)
+        result = IngestionResponse(received=len(tickets))
+
+        fresh: List[TicketIngest] = []
+        fresh_ids: Set[int] = set()
+        for ticket in tickets:
+            # Later copies of an id already headed to the DB must be compared against it, not the cache
+            if ticket.id not in fresh_ids and ticket_cache.is_unchanged(ticket.id, ticket.updated_at):
+                result.skipped += 1
+                continue
+            fresh.append(ticket)
+            fresh_ids.add(ticket.id)
+
+        with stage("load_existing"):
+            existing = repo.get_rows_by_ids(fresh_ids)
+        logger.info(f"Loaded {len(existing)} existing tickets for batch, {result.skipped} skipped by cache")
+
+        pending: Dict[int, Dict[str, Any]] = {}
+        history: List[TicketIngest] = []
+        for ticket in fresh:
+            current = pending.get(ticket.id) or existing.get(ticket.id)
+            if current is None:
+                pending[ticket.id] = ticket.model_dump()
+                result.inserted += 1
+                continue
+
+            if self._is_same_update(current["updated_at"], ticket.updated_at):
+                result.skipped += 1
+                continue
+
+            history.append(ticket)
+            pending[ticket.id] = self._update_existing_ticket(current, ticket)
+            result.updated += 1
+
+        written = list(pending.values())
+        with stage("sla_deadlines"):
+            self._apply_sla_deadlines(written)
+        with stage("upsert"):
+            levels = repo.bulk_upsert(written, settings.ESCALATION_ALERT_REMAINING_PERCENT)
+        # Moved deadlines may have lowered the stored level; the timers must see what was written
+        for row in written:
+            row["escalation_level"] = levels.get(row["id"], row.get("escalation_level"))
+        with stage("history"):
+            TicketHistoryRepository(session).bulk_save(history)
+
+        versions = {ticket_id: row["updated_at"] for ticket_id, row in existing.items()}
+        versions.update({ticket_id: row["updated_at"] for ticket_id, row in pending.items()})
+        return result, versions, written
+
+    def _apply_sla_deadlines(self, rows: List[Dict[str, Any]]) -> None:
+        if not rows:
+            return
+        # Deadlines come from the SLA matrix, never from the client; one matrix snapshot per batch
+        response, resolution = SLAConfig.matrix().deadlines(
+            [row["priority"] for row in rows],
+            [row["customer_tier"] for row in rows],
+            [row["created_at"] for row in rows],
+        )
+        for row, response_deadline, resolution_deadline in zip(rows, response, resolution):
+            row["response_sla_deadline"] = response_deadline
+            row["resolution_sla_deadline"] = resolution_deadline
+
+    def recompute_sla_deadlines(
+        self,
+        matrix: SLAMatrix,
+        cells: Sequence[Tuple[Priority, Optional[CustomerTier]]],
     ) -> None:
-        self._validate_ticket_id(ticket)
-        ticket.updated_at = to_datetime(ticket.updated_at)
-
-        existing = repo.get_by_id(ticket.id)
-        if existing:
-            logger.info(f"Existing ticket found: id={ticket.id}, updated_at={existing.updated_at}")
-            if self._is_same_update(existing, ticket):
-                logger.info(f"No changes detected for ticket {ticket.id}, skipping")
-                return
-
-            self._save_history(ticket, session)
-            self._update_existing_ticket(existing, ticket)
-            logger.info(f"Updated ticket {ticket.id}")
-        else:
-            repo.save(ticket)
-            logger.info(f"Saved new ticket {ticket.id}")
-
-    def _validate_ticket_id(self, ticket: Ticket) -> None:
+        logger.info(f"Recomputing open ticket deadlines for {len(cells)} changed SLA cells")
+        try:
+            with Session(engine) as session:
+                repo = TicketRepository(session)
+                rows: List[RowMapping] = []
+                for priority, customer_tier in cells:
+                    rows.extend(repo.recompute_open_deadlines(
+                        priority,
+                        customer_tier,
+                        *matrix.cell(priority, customer_tier),
+                        settings.ESCALATION_ALERT_REMAINING_PERCENT,
+                    ))
+                session.commit()
+        except SQLAlchemyError as db_err:
+            logger.exception(f"Database error recomputing SLA deadlines: {db_err}")
+            raise DBException("Error recomputing SLA deadlines")
+
+        escalation_timers.track(rows)
+        logger.info(f"Recomputed deadlines for {len(rows)} open tickets")
+
+    def _validate_ticket_id(self, ticket: TicketIngest) -> None:
         ticket_id = getattr(ticket, "id", None)
         if ticket_id is None:
             logger.error("Ticket id is missing in incoming data")
             raise UseCaseException("Id missing")
 
-    def _is_same_update(self, existing: Ticket, incoming: Ticket) -> bool:
+    def _is_same_update(self, existing_updated_at: datetime, incoming_updated_at: datetime) -> bool:
         return (
-            existing.updated_at.isoformat(timespec="seconds")
-            == incoming.updated_at.isoformat(timespec="seconds")
+            update_fingerprint(existing_updated_at)
+            == update_fingerprint(incoming_updated_at)
         )
 
-    def _save_history(self, ticket: Ticket, session: Session) -> None:
-        logger.info(f"Saving history for ticket {ticket.id}")
-        TicketHistoryRepository(session).save(ticket)
-
-    def _update_existing_ticket(self, existing: Ticket, incoming: Ticket) -> None:
-        existing.priority = incoming.priority
-        existing.updated_at = incoming.updated_at
-        existing.created_at = incoming.created_at
-        existing.status = incoming.status
-        existing.customer_tier = incoming.customer_tier
-
-    def escalate_workflow(self) -> None:
+    def _update_existing_ticket(self, existing: Dict[str, Any], incoming: TicketIngest) -> Dict[str, Any]:
+        return {
+            **existing,
+            "priority": incoming.priority,
+            "updated_at": incoming.updated_at,
+            "created_at": incoming.created_at,
+            "status": incoming.status,
+            "customer_tier": incoming.customer_tier,
+        }
+
+    async def escalate_workflow(self) -> None:
         logger.info("Starting escalation workflow")
-        with Session(engine) as session:
+        await self._run_escalation()
+
+    async def escalate_tickets(self, ticket_ids: Collection[int]) -> None:
+        logger.info(f"Escalating {len(ticket_ids)} tickets that crossed an SLA threshold")
+        await self._run_escalation(ticket_ids)
+
+    async def get_open_ticket_deadlines(self) -> Sequence[Tuple[int, datetime, datetime, Optional[EscalationLevel]]]:
+        async with AsyncSession(async_engine) as session:
+            return await TicketEscalationRepository(session).get_open_deadlines()
+
+    async def _run_escalation(self, ticket_ids: Optional[Collection[int]] = None) -> None:
+        # Candidates are claimed in batches with FOR UPDATE SKIP LOCKED, so replicas running
+        # this concurrently split the work and a crashed replica's claims are released with its connection
+        batch_size = settings.ESCALATION_BATCH_SIZE
+        escalated = 0
+        with instrumentation.run("escalation"):
+            while True:
+                claimed, batch_escalated = await self._run_escalation_batch(ticket_ids, batch_size)
+                escalated += batch_escalated
+                if claimed < batch_size or batch_escalated == 0:
+                    break
+        logger.info(f"Escalation workflow completed, {escalated} tickets escalated")
+
+    async def _run_escalation_batch(
+        self, ticket_ids: Optional[Collection[int]], batch_size: int
+    ) -> Tuple[int, int]:
+        async with AsyncSession(async_engine) as session:
             try:
-                tickets: Sequence[Ticket] = self._fetch_open_tickets(session)
-                logger.info(f"Found {len(tickets)} open tickets to evaluate")
-                for ticket in tickets:
-                    self._process_ticket(ticket)
-                session.commit()
-                logger.info("Escalation workflow completed")
+                # One clock reading per batch, shared by the SQL prefilter and the evaluator
+                now = datetime.now(timezone.utc)
+                with stage("query"):
+                    candidates = await self._fetch_escalation_candidates(session, ticket_ids, batch_size, now)
+                logger.info(f"Claimed {len(candidates)} open tickets inside the alert window")
+                increment("scanned", len(candidates))
+
+                with stage("evaluate"):
+                    evaluation = evaluate_sla_batch(
+                        candidates, now.timestamp(), settings.ESCALATION_ALERT_REMAINING_PERCENT
+                    )
+                increment("alerted", len(evaluation.alert))
+                increment("breached", len(evaluation.breach))
+
+                escalated = await self._apply_escalations(session, candidates, evaluation, now)
+                with stage("commit"):
+                    await session.commit()
             except Exception as e:
-                session.rollback()
+                await session.rollback()
                 logger.exception(f"Error escalating workflow: {e}")
                 raise UnexpectedException(f"Error escalating: {e}")
 
+        if escalated:
+            alert_sinks.wake()
+        return len(candidates), escalated
+
     def get_tickets_paginated(
         self,
         *,
         status: Optional[TicketStatus] = None,
         page: int = 1,
         page_size: int = 10,
+        exact: bool = False,
     ) -> Tuple[List[TicketResponse], int]:
-        logger.info(f"Fetching tickets page={page}, size={page_size}, status={status}")
+        logger.info(f"Fetching tickets page={page}, size={page_size}, status={status}, exact={exact}")
         try:
             with Session(engine) as session:
                 repo = TicketRepository(session)
                 tickets, total = repo.get_paginated(
-                    status=status, page=page, page_size=page_size
+                    status=status, page=page, page_size=page_size, exact_total=exact
                 )
 
-                responses: List[TicketResponse] = []
-                for t in tickets:
-                    remaining = calculate_remaining_seconds(
-                        t.created_at, t.resolution_sla_deadline
-                    )
-                    responses.append(
-                        TicketResponse(
-                            status=t.status,
-                            escalation_level=t.escalation_level,
-                            remaining_seconds=remaining,
-                        )
-                    )
+                responses = [self._to_ticket_response(t) for t in tickets]
 
                 logger.info(f"Returning {len(responses)} tickets out of total {total}")
                 return responses, total
@@ -172,63 +416,95 @@ class TicketService:
             logger.exception(f"Unexpected error fetching paginated tickets: {err}")
             raise UnexpectedException(f"Unexpected error fetching tickets: {err}")
 
-    def _fetch_open_tickets(self, session: Session) -> Sequence[Ticket]:
-        logger.info("Querying open tickets from repository")
-        return TicketRepository(session).get_open_tickets()
+    def get_tickets_by_cursor(
+        self,
+        *,
+        status: Optional[TicketStatus] = None,
+        cursor: Optional[str] = None,
+        page_size: int = 10,
+        exact: bool = False,
+    ) -> Tuple[List[TicketResponse], int, Optional[str]]:
+        """One keyset page of the dashboard ordered by resolution deadline, the total and the next page's cursor."""
+        after = decode_cursor(cursor) if cursor else None
+        logger.info(f"Fetching tickets after cursor={after}, size={page_size}, status={status}")
+        try:
+            with Session(engine) as session:
+                repo = TicketRepository(session)
+                # One extra row tells whether another page exists without counting
+                tickets = repo.get_page_after(status=status, after=after, limit=page_size + 1)
+                total = repo.count(status=status) if exact else TicketStatusCountRepository(session).total(status)
 
-    def _process_ticket(self, ticket: Ticket) -> None:
-        if ticket.resolution_sla_deadline is None:
-            logger.info(f"Ticket {ticket.id} has no SLA deadline, skipping")
-            return
+                next_cursor = None
+                if len(tickets) > page_size:
+                    tickets = tickets[:page_size]
+                    last = tickets[-1]
+                    next_cursor = encode_cursor(last.resolution_sla_deadline, last.id)
 
-        created_at, deadline = self._ensure_timezone(
-            ticket.created_at, ticket.resolution_sla_deadline
+                responses = [self._to_ticket_response(t) for t in tickets]
+                logger.info(f"Returning {len(responses)} tickets out of total {total}, more={next_cursor is not None}")
+                return responses, total, next_cursor
+
+        except SQLAlchemyError as db_err:
+            logger.exception(f"Database error fetching tickets by cursor: {db_err}")
+            raise DBException("Database error fetching tickets")
+        except Exception as err:
+            logger.exception(f"Unexpected error fetching tickets by cursor: {err}")
+            raise UnexpectedException(f"Unexpected error fetching tickets: {err}")
+
+    def _to_ticket_response(self, ticket: Ticket) -> TicketResponse:
+        return TicketResponse(
+            status=ticket.status,
+            escalation_level=ticket.escalation_level,
+            remaining_seconds=calculate_remaining_seconds(ticket.created_at, ticket.resolution_sla_deadline),
         )
-        remaining_percent: float = self._calculate_remaining_percent(created_at, deadline)
-
-        if 0 < remaining_percent <= 15:
-            self._handle_alert(ticket, remaining_percent)
-        elif remaining_percent <= 0:
-            self._handle_breach(ticket, remaining_percent)
-
-    def _ensure_timezone(
-        self, created_at: datetime, deadline: datetime
-    ) -> Tuple[datetime, datetime]:
-        if created_at.tzinfo is None:
-            created_at = created_at.replace(tzinfo=timezone.utc)
-        if deadline.tzinfo is None:
-            deadline = deadline.replace(tzinfo=timezone.utc)
-        return created_at, deadline
-
-    def _calculate_remaining_percent(
-        self, created_at: datetime, deadline: datetime
-    ) -> float:
-        total_seconds = (deadline - created_at).total_seconds()
-        remaining_seconds = calculate_remaining_seconds(created_at, deadline)
-        return 100.0 - ((remaining_seconds / total_seconds) * 100.0)
-    
-    def _send_slack_webhook(self, ticket_id: int, remaining_percent: float) -> None:
-        slack_webhook = SlackWebhook()
-        response = slack_webhook.send_alert(ticket_id, remaining_percent)
-        data = response.json()
-        logger.info(f"[Slack] webhook response for ticket {ticket_id}:\n{json.dumps(data, indent=2)}")
-
-    def _handle_alert(self, ticket: Ticket, remaining_percent: float) -> None:
-        logger.info(f"[ALERT] Ticket {ticket.id}: {remaining_percent:.2f}% SLA remaining")
-        ticket.escalation_level = EscalationLevel.ALERT
-        self._send_slack_webhook(ticket.id, remaining_percent)
-        self._schedule_broadcast(ticket.id, "ALERT", remaining_percent)
-
-    def _handle_breach(self, ticket: Ticket, remaining_percent: float) -> None:
-        logger.info(f"[BREACH] Ticket {ticket.id}: SLA violated")
-        ticket.escalation_level = EscalationLevel.BREACH
-        self._send_slack_webhook(ticket.id, remaining_percent)
-        self._schedule_broadcast(ticket.id, "BREACH", remaining_percent)
-
-    def _schedule_broadcast(self, ticket_id: int, event: str, remaining_percent: float):
-        payload = json.dumps({
+
+    async def _fetch_escalation_candidates(
+        self,
+        session: AsyncSession,
+        ticket_ids: Optional[Collection[int]],
+        limit: int,
+        now: datetime,
+    ) -> Sequence[Row[Any]]:
+        logger.info("Querying escalation candidates from repository")
+        return await TicketEscalationRepository(session).get_escalation_candidates(
+            now=now,
+            max_remaining_percent=settings.ESCALATION_ALERT_REMAINING_PERCENT,
+            ticket_ids=ticket_ids,
+            limit=limit,
+        )
+
+    async def _apply_escalations(
+        self,
+        session: AsyncSession,
+        candidates: Sequence[Row[Any]],
+        evaluation: SLAEvaluation,
+        escalated_at: datetime,
+    ) -> int:
+        repo = TicketEscalationRepository(session)
+        with stage("update"):
+            await repo.set_escalation_level([candidates[i].id for i in evaluation.alert], EscalationLevel.ALERT, escalated_at)
+            await repo.set_escalation_level([candidates[i].id for i in evaluation.breach], EscalationLevel.BREACH, escalated_at)
+
+        outbox: List[Dict[str, Any]] = []
+        for i in evaluation.alert:
+            remaining_percent = float(evaluation.remaining_percent[i])
+            logger.info(f"[ALERT] Ticket {candidates[i].id}: {remaining_percent:.2f}% SLA remaining")
+            outbox.append(self._outbox_row(candidates[i], EscalationLevel.ALERT, remaining_percent))
+        for i in evaluation.breach:
+            logger.info(f"[BREACH] Ticket {candidates[i].id}: SLA violated")
+            outbox.append(self._outbox_row(candidates[i], EscalationLevel.BREACH, float(evaluation.remaining_percent[i])))
+
+        # Notifications are only recorded here, in the same transaction as the level change;
+        # each sink's channel delivers them after commit
+        with stage("outbox"):
+            await EscalationOutboxRepository(session).add(outbox, alert_sinks.names())
+        return len(outbox)
+
+    def _outbox_row(self, candidate: Row[Any], event: EscalationLevel, remaining_percent: float) -> Dict[str, Any]:
+        return {
+            "ticket_id": candidate.id,
             "event": event,
-            "ticket_id": ticket_id,
             "remaining_percent": remaining_percent,
-        })
-        manager.schedule_broadcast(payload)
+            "priority": candidate.priority,
+            "customer_tier": candidate.customer_tier,
+        }
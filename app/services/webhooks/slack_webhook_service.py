@@ -1,18 +1,49 @@
-from requests import Response
+import asyncio
+from typing import List, Optional, Sequence, Tuple
+
+from httpx import Response
 from app.config.settings import settings
 from app.services.webhooks.generic_webhook import WebhookService
+from app.services.webhooks.webhook_dispatcher import webhook_dispatcher
+
+# (ticket_id, event, remaining_percent)
+Escalation = Tuple[int, str, float]
 
 class SlackWebhook:
-    def __init__(self):
+    def __init__(self, base_url: Optional[str] = None, timeout: float = 5):
+        base_url = base_url or settings.SLACK_WEBHOOK_URL
         self.webhook = WebhookService(
-            base_url=settings.SLACK_WEBHOOK_URL,
+            base_url=base_url,
             default_headers={
                 "Content-Type": "application/json"
-            }
+            },
+            timeout=timeout,
         )
+        # Incoming webhooks are limited to roughly one message per second
+        webhook_dispatcher.set_rate_limit(base_url, settings.SLACK_RATE_PER_SECOND, settings.SLACK_RATE_BURST)
 
-    def send_alert(self, ticket_id: int, percent: float) -> Response:
+    async def send_alert(self, ticket_id: int, percent: float) -> Response:
         payload = {
             "text": f":warning: SLA alert for Ticket #{ticket_id}: only {percent:.2f}% remaining."
         }
-        return self.webhook.post("slack/mock", payload)
+        return await self.webhook.post("slack/mock", payload)
+
+    async def send_digest(self, escalations: Sequence[Escalation]) -> List[Response]:
+        """Post the escalations as a few batched messages instead of one message per ticket."""
+        max_lines = settings.SLACK_DIGEST_MAX_LINES
+        messages = [escalations[start:start + max_lines] for start in range(0, len(escalations), max_lines)]
+        return await asyncio.gather(*(
+            self.webhook.post("slack/mock", {"text": self._digest_text(message, index, len(messages))})
+            for index, message in enumerate(messages, start=1)
+        ))
+
+    def _digest_text(self, escalations: Sequence[Escalation], part: int, parts: int) -> str:
+        breached = sum(1 for _, event, _ in escalations if event == "BREACH")
+        header = f":rotating_light: SLA digest: {breached} breached, {len(escalations) - breached} alerted"
+        if parts > 1:
+            header += f" (part {part}/{parts})"
+        lines = [
+            f"• Ticket #{ticket_id} {event}: {remaining_percent:.2f}% remaining"
+            for ticket_id, event, remaining_percent in escalations
+        ]
+        return "\n".join([header, *lines])
@@ -0,0 +1,191 @@
+import asyncio
+import logging
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from time import monotonic, perf_counter
+from typing import Any, Dict, NamedTuple, Optional
+
+import httpx
+
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on how long a single Retry-After is honoured before retrying anyway
+RETRY_AFTER_MAX_SECONDS = 60.0
+
+class TokenBucket:
+    """Paces sends to one host at `rate` per second, allowing bursts of up to `burst` messages."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = monotonic()
+        self._resume_at = 0.0
+
+    async def acquire(self) -> None:
+        while True:
+            now = monotonic()
+            if now < self._resume_at:
+                await asyncio.sleep(self._resume_at - now)
+                continue
+
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        # A 429 applies to every sender of this host, not only the request that got it
+        self._resume_at = max(self._resume_at, monotonic() + seconds)
+        self._tokens = 0.0
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), RETRY_AFTER_MAX_SECONDS)
+
+class WebhookRequest(NamedTuple):
+    base_url: str
+    endpoint: str
+    payload: Dict[str, Any]
+    headers: Dict[str, str]
+    timeout: float
+
+class WebhookDispatcher:
+    """Sends webhook POSTs through one pooled client per base URL, with rate limits and retries.
+
+    Delivery runs on the caller's task; queueing and concurrency limits belong to the alert sinks.
+    """
+
+    def __init__(
+        self,
+        max_connections: int,
+        max_retries: int,
+        backoff_base_seconds: float,
+        backoff_max_seconds: float,
+    ):
+        self.max_connections = max_connections
+        self.max_retries = max_retries
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._rate_limits: Dict[str, TokenBucket] = {}
+        self.attempts = 0
+        self.delivered = 0
+        self.failed = 0
+        self.retries = 0
+        self.throttled = 0
+        self._latency_total = 0.0
+
+    async def stop(self) -> None:
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients.clear()
+
+    def set_rate_limit(self, base_url: str, rate: float, burst: int) -> None:
+        self._rate_limits[base_url] = TokenBucket(rate, burst)
+
+    async def post(
+        self,
+        base_url: str,
+        endpoint: str,
+        payload: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 5,
+    ) -> httpx.Response:
+        return await self._deliver(WebhookRequest(base_url, endpoint, payload, headers or {}, timeout))
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "clients": len(self._clients),
+            "attempts": self.attempts,
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "retries": self.retries,
+            "throttled": self.throttled,
+            "avg_latency": self._latency_total / self.attempts if self.attempts else 0.0,
+        }
+
+    def _client(self, base_url: str) -> httpx.AsyncClient:
+        client = self._clients.get(base_url)
+        if client is None:
+            client = httpx.AsyncClient(
+                base_url=base_url,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections, max_keepalive_connections=self.max_connections
+                ),
+            )
+            self._clients[base_url] = client
+        return client
+
+    async def _deliver(self, request: WebhookRequest) -> httpx.Response:
+        url = f"{request.base_url.rstrip('/')}/{request.endpoint.lstrip('/')}"
+        client = self._client(request.base_url)
+        bucket = self._rate_limits.get(request.base_url)
+        attempt = 0
+        while True:
+            retry_after: Optional[float] = None
+            try:
+                if bucket is not None:
+                    await bucket.acquire()
+                response = await self._attempt(client, url, request)
+                # Rate limits and server errors are retried; anything else is final
+                retryable = response.status_code == 429 or response.status_code >= 500
+                if not retryable or attempt >= self.max_retries:
+                    response.raise_for_status()
+                    self.delivered += 1
+                    logger.info(f"Webhook POST to {url} succeeded with status {response.status_code}")
+                    return response
+                reason = f"status {response.status_code}"
+                if response.status_code == 429:
+                    self.throttled += 1
+                    retry_after = _retry_after_seconds(response)
+                    if retry_after is not None and bucket is not None:
+                        bucket.pause(retry_after)
+            except httpx.HTTPStatusError as e:
+                self.failed += 1
+                logger.error(f"Failed to POST webhook to {url}: {e}")
+                raise
+            except httpx.TransportError as e:
+                # Timeouts and connection errors
+                if attempt >= self.max_retries:
+                    self.failed += 1
+                    logger.error(f"Failed to POST webhook to {url} after {attempt + 1} attempts: {e!r}")
+                    raise
+                reason = repr(e)
+
+            attempt += 1
+            self.retries += 1
+            delay = retry_after if retry_after is not None else random.uniform(
+                0, min(self.backoff_max_seconds, self.backoff_base_seconds * 2 ** attempt)
+            )
+            logger.warning(f"Webhook POST to {url} failed ({reason}), retry {attempt}/{self.max_retries} in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+    async def _attempt(self, client: httpx.AsyncClient, url: str, request: WebhookRequest) -> httpx.Response:
+        start = perf_counter()
+        try:
+            return await client.post(url, json=request.payload, headers=request.headers, timeout=request.timeout)
+        finally:
+            self.attempts += 1
+            self._latency_total += perf_counter() - start
+
+webhook_dispatcher = WebhookDispatcher(
+    max_connections=settings.WEBHOOK_MAX_CONNECTIONS,
+    max_retries=settings.WEBHOOK_MAX_RETRIES,
+    backoff_base_seconds=settings.WEBHOOK_BACKOFF_BASE_SECONDS,
+    backoff_max_seconds=settings.WEBHOOK_BACKOFF_MAX_SECONDS,
+)
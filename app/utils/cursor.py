@@ -0,0 +1,21 @@
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+
+from app.exceptions.exceptions import UseCaseException
+
+# Keyset position on the dashboard sort key: (resolution_sla_deadline, id) of the last row returned
+DashboardCursor = Tuple[datetime, int]
+
+def encode_cursor(deadline: datetime, ticket_id: int) -> str:
+    raw = json.dumps([deadline.isoformat(), ticket_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(token: str) -> DashboardCursor:
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        deadline, ticket_id = json.loads(raw)
+        return datetime.fromisoformat(deadline), int(ticket_id)
+    except (ValueError, TypeError) as e:
+        raise UseCaseException(f"Invalid dashboard cursor: {e}")
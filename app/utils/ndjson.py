@@ -0,0 +1,16 @@
+from typing import AsyncIterable, AsyncIterator, Tuple
+
+async def iter_ndjson_lines(stream: AsyncIterable[bytes]) -> AsyncIterator[Tuple[int, bytes]]:
+    """Yield (line_number, raw_line) pairs from a byte stream without buffering the whole body."""
+    buffer = b""
+    line_no = 0
+    async for chunk in stream:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_no += 1
+            if line.strip():
+                yield line_no, line
+
+    if buffer.strip():
+        yield line_no + 1, buffer
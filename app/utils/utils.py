@@ -1,11 +1,20 @@
 from datetime import datetime, timezone
 from typing import Union, Optional
 
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
+
 def to_datetime(value: Union[str, datetime]) -> datetime:
     if isinstance(value, str):
         return datetime.fromisoformat(value.replace("Z", "+00:00"))
     return value
 
+def update_fingerprint(updated_at: datetime) -> str:
+    return updated_at.isoformat(timespec="seconds")
+
+def describe_db_error(error: SQLAlchemyError) -> str:
+    cause = error.orig if isinstance(error, DBAPIError) else error
+    return str(cause).strip().splitlines()[0]
+
 def calculate_remaining_seconds(created_at: datetime, deadline: Optional[datetime]) -> float:
     if not deadline:
         return 0.0
@@ -0,0 +1,157 @@
+import asyncio
+import json
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import asyncpg  # type: ignore
+from sqlalchemy import text
+
+from app.config.settings import settings
+from app.db.db import async_engine, database_url
+from app.dto.alert_event import AlertEvent
+
+logger = logging.getLogger(__name__)
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+NOTIFY_MAX_PAYLOAD_BYTES = 7900
+
+AlertHandler = Callable[[List[AlertEvent]], Any]
+
+class AlertBackbone(ABC):
+    """Carries escalation events published by one process to the websocket clients of every process."""
+
+    def __init__(self):
+        self._handler: Optional[AlertHandler] = None
+        self.published = 0
+        self.received = 0
+        self.messages = 0
+
+    async def start(self, handler: AlertHandler) -> None:
+        self._handler = handler
+
+    async def stop(self) -> None:
+        self._handler = None
+
+    @abstractmethod
+    async def publish(self, events: Sequence[AlertEvent]) -> None:
+        ...
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "type": type(self).__name__,
+            "published": self.published,
+            "received": self.received,
+            "messages": self.messages,
+        }
+
+    def _receive(self, events: List[AlertEvent]) -> None:
+        self.received += len(events)
+        if self._handler is not None:
+            self._handler(events)
+
+class InMemoryBackbone(AlertBackbone):
+    """Single-process backbone (the default): published events go straight to the local handler."""
+
+    async def publish(self, events: Sequence[AlertEvent]) -> None:
+        if not events:
+            return
+        self.published += len(events)
+        self.messages += 1
+        self._receive(list(events))
+
+class PostgresBackbone(AlertBackbone):
+    """Fans events out through Postgres LISTEN/NOTIFY so every worker and replica sees them.
+
+    A batch of events is sent as as few NOTIFY payloads as fit under the size limit. Each process keeps
+    one dedicated listening connection and reconnects if it drops.
+
+    A failed publish raises, so the websocket sink's outbox deliveries stay pending and are retried. What a
+    process misses while its listener reconnects is not retried; its clients recover through replay.
+    """
+
+    def __init__(self, dsn: str, channel: str, reconnect_seconds: float = 1.0):
+        super().__init__()
+        self.dsn = dsn
+        self.channel = channel
+        self.reconnect_seconds = reconnect_seconds
+        self._task: Optional[asyncio.Task[None]] = None
+        self.reconnects = 0
+
+    async def start(self, handler: AlertHandler) -> None:
+        await super().start(handler)
+        self._task = asyncio.create_task(self._listen())
+        logger.info(f"Listening for alerts on Postgres channel {self.channel}")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await super().stop()
+
+    async def publish(self, events: Sequence[AlertEvent]) -> None:
+        payloads = self._payloads(events)
+        if not payloads:
+            return
+        # pg_notify inside one transaction: listeners get the whole batch on commit, or none of it
+        async with async_engine.begin() as conn:
+            for payload in payloads:
+                await conn.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": self.channel, "payload": payload})
+        self.published += len(events)
+        self.messages += len(payloads)
+
+    def stats(self) -> Dict[str, Any]:
+        return {**super().stats(), "channel": self.channel, "reconnects": self.reconnects}
+
+    def _payloads(self, events: Sequence[AlertEvent]) -> List[str]:
+        payloads: List[str] = []
+        chunk: List[str] = []
+        size = 2
+        for event in events:
+            encoded = event.model_dump_json()
+            if chunk and size + len(encoded) + 1 > NOTIFY_MAX_PAYLOAD_BYTES:
+                payloads.append(f"[{','.join(chunk)}]")
+                chunk, size = [], 2
+            chunk.append(encoded)
+            size += len(encoded) + 1
+        if chunk:
+            payloads.append(f"[{','.join(chunk)}]")
+        return payloads
+
+    async def _listen(self) -> None:
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _: closed.set())
+                await connection.add_listener(self.channel, self._on_notify)
+                await closed.wait()
+                logger.warning(f"Alert backbone connection lost, reconnecting in {self.reconnect_seconds}s")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Alert backbone listen failed, retrying in {self.reconnect_seconds}s: {e}")
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+            self.reconnects += 1
+            await asyncio.sleep(self.reconnect_seconds)
+
+    def _on_notify(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        try:
+            events = [AlertEvent.model_validate(item) for item in json.loads(payload)]
+        except ValueError as e:
+            logger.error(f"Discarding malformed alert notification: {e}")
+            return
+        self._receive(events)
+
+def build_backbone(kind: str) -> AlertBackbone:
+    if kind == "postgres":
+        return PostgresBackbone(dsn=database_url, channel=settings.ALERT_BACKBONE_CHANNEL)
+    if kind == "memory":
+        return InMemoryBackbone()
+    raise ValueError(f"Unknown alert backbone: {kind}")
+
+alert_backbone = build_backbone(settings.ALERT_BACKBONE)
@@ -0,0 +1,46 @@
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, Dict, List, Mapping, NamedTuple, Optional
+
+class BufferedAlert(NamedTuple):
+    seq: int
+    payload: str
+    event: Mapping[str, Any]
+
+class AlertHistory:
+    """Bounded ring buffer of recently broadcast alerts, so reconnecting clients can replay what they missed.
+
+    Replay is by arrival position rather than by comparing sequence numbers: events from concurrent
+    sink workers can arrive slightly out of seq order, and a client's `last_seq` marks where it stopped.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._buffer: Deque[BufferedAlert] = deque(maxlen=capacity)
+        # seq -> arrival position of its latest copy; outbox redelivery can repeat a seq
+        self._positions: Dict[int, int] = {}
+        self._next_position = 0
+
+    def append(self, alert: BufferedAlert) -> None:
+        if len(self._buffer) == self.capacity:
+            evicted = self._buffer[0]
+            if self._positions.get(evicted.seq) == self._next_position - self.capacity:
+                del self._positions[evicted.seq]
+        self._buffer.append(alert)
+        self._positions[alert.seq] = self._next_position
+        self._next_position += 1
+
+    def since(self, last_seq: int) -> Optional[List[BufferedAlert]]:
+        """Alerts that arrived after `last_seq`, or None when it is no longer (or never was) buffered."""
+        position = self._positions.get(last_seq)
+        if position is None:
+            return None
+        first_position = self._next_position - len(self._buffer)
+        return list(islice(self._buffer, position - first_position + 1, None))
+
+    @property
+    def oldest_seq(self) -> Optional[int]:
+        return self._buffer[0].seq if self._buffer else None
+
+    def __len__(self) -> int:
+        return len(self._buffer)
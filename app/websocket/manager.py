@@ -1,29 +1,162 @@
 import asyncio
-from typing import List
+import json
+import logging
+from typing import Any, Dict, Mapping, Optional, Sequence, Set
 from fastapi import WebSocket
 
-class ConnectionManager:
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
-        self._loop: asyncio.AbstractEventLoop | None = None
+from app.config.settings import settings
+from app.dto.alert_event import AlertEvent
+from app.dto.alert_subscription import AlertSubscription
+from app.websocket.history import AlertHistory, BufferedAlert
+from app.websocket.subscriptions import SubscriptionIndex
+
+logger = logging.getLogger(__name__)
+
+# "Try again later": the client fell behind and should reconnect
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+# Sent instead of a replay when the client's last_seq has left the buffer; it should reload the dashboard
+RESYNC_NEEDED = "RESYNC_NEEDED"
 
-    def set_loop(self, loop: asyncio.AbstractEventLoop):
-        self._loop = loop
+class ClientConnection:
+    """One dashboard socket with its own bounded outbound queue and writer task."""
 
-    async def connect(self, ws: WebSocket):
+    def __init__(self, ws: WebSocket, queue_size: int):
+        self.ws = ws
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=queue_size)
+        self.writer: Optional[asyncio.Task[None]] = None
+
+class ConnectionManager:
+    def __init__(self, queue_size: int, send_timeout: float, replay_buffer_size: int):
+        self.queue_size = queue_size
+        self.send_timeout = send_timeout
+        self.active_connections: Dict[WebSocket, ClientConnection] = {}
+        self.subscriptions: SubscriptionIndex[ClientConnection] = SubscriptionIndex()
+        self.history = AlertHistory(replay_buffer_size)
+        self.evicted = {"overflow": 0, "timeout": 0, "error": 0}
+        self.replayed = 0
+        self.resyncs = 0
+        # The loop only holds tasks weakly; keep closes of evicted sockets alive until they finish
+        self._closing: Set[asyncio.Task[None]] = set()
+
+    async def connect(self, ws: WebSocket, last_seq: Optional[int] = None, subscription: Optional[AlertSubscription] = None):
         await ws.accept()
-        self.active_connections.append(ws)
+        client = ClientConnection(ws, self.queue_size)
+        client.writer = asyncio.create_task(self._write(client))
+        self.active_connections[ws] = client
+        # Until a client narrows it, its feed is everything; replay is filtered by the subscription it connected with
+        self.subscriptions.subscribe(client, subscription or AlertSubscription())
+        if last_seq is not None:
+            # No await between registering and replaying, so nothing broadcast meanwhile is missed or repeated
+            self._replay(client, last_seq)
 
     def disconnect(self, ws: WebSocket):
-        self.active_connections.remove(ws)
+        client = self.active_connections.pop(ws, None)
+        if client is None:
+            return
+        self.subscriptions.unsubscribe(client)
+        if client.writer is not None and client.writer is not asyncio.current_task():
+            client.writer.cancel()
+
+    def subscribe(self, ws: WebSocket, subscription: AlertSubscription) -> None:
+        client = self.active_connections.get(ws)
+        if client is not None:
+            self.subscriptions.subscribe(client, subscription)
+
+    def send(self, ws: WebSocket, message: str) -> None:
+        client = self.active_connections.get(ws)
+        if client is not None:
+            self._enqueue(client, message)
+
+    def broadcast(self, message: str, event: Optional[Mapping[str, Any]] = None) -> int:
+        """Queue `message` for every client whose filters match `event` (all clients when omitted)
+        without waiting on any socket; returns how many accepted it."""
+        if event is None:
+            targets = list(self.active_connections.values())
+        else:
+            targets = list(self.subscriptions.match(event))
+        return sum(self._enqueue(client, message) for client in targets)
+
+    def broadcast_events(self, events: Sequence[AlertEvent]) -> None:
+        for event in events:
+            payload = json.dumps({
+                "seq": event.seq,
+                "event": event.event,
+                "ticket_id": event.ticket_id,
+                "remaining_percent": event.remaining_percent,
+                "priority": event.priority,
+                "customer_tier": event.customer_tier,
+            })
+            attributes = event.model_dump()
+            self.history.append(BufferedAlert(event.seq, payload, attributes))
+            self.broadcast(payload, attributes)
+
+    def _replay(self, client: ClientConnection, last_seq: int) -> None:
+        missed = self.history.since(last_seq)
+        matched = [alert for alert in missed or [] if self.subscriptions.accepts(client, alert.event)]
+        # A replay that would overflow the client's queue is no cheaper than a resync
+        if missed is None or len(matched) >= self.queue_size:
+            self.resyncs += 1
+            self._enqueue(client, json.dumps({"event": RESYNC_NEEDED, "last_seq": last_seq, "oldest_seq": self.history.oldest_seq}))
+            return
+        self.replayed += len(matched)
+        for alert in matched:
+            self._enqueue(client, alert.payload)
+
+    def _enqueue(self, client: ClientConnection, message: str) -> bool:
+        try:
+            client.queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            self._evict(client, "overflow")
+            return False
+
+    def stats(self) -> Dict[str, int]:
+        depths = [client.queue.qsize() for client in self.active_connections.values()]
+        return {
+            "connections": len(depths),
+            "queued_messages": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "evicted_overflow": self.evicted["overflow"],
+            "evicted_timeout": self.evicted["timeout"],
+            "evicted_error": self.evicted["error"],
+            "replay_buffered": len(self.history),
+            "replayed": self.replayed,
+            "resyncs": self.resyncs,
+        }
+
+    async def _write(self, client: ClientConnection) -> None:
+        while True:
+            message = await client.queue.get()
+            try:
+                await asyncio.wait_for(client.ws.send_text(message), self.send_timeout)
+            except asyncio.TimeoutError:
+                self._evict(client, "timeout")
+                return
+            except Exception as e:
+                logger.info(f"Dropping websocket client after send error: {e}")
+                self._evict(client, "error")
+                return
 
-    async def broadcast(self, message: str):
-        for ws in self.active_connections:
-            await ws.send_text(message)
+    def _evict(self, client: ClientConnection, reason: str) -> None:
+        if client.ws not in self.active_connections:
+            return
+        self.evicted[reason] += 1
+        logger.warning(f"Evicting websocket client ({reason}), {client.queue.qsize()} messages pending")
+        self.disconnect(client.ws)
+        task = asyncio.create_task(self._close(client.ws))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
 
-    def schedule_broadcast(self, message: str):
-        if not self._loop:
-            raise RuntimeError("Event loop não foi configurado")
-        asyncio.run_coroutine_threadsafe(self.broadcast(message), self._loop)
+    async def _close(self, ws: WebSocket) -> None:
+        try:
+            await asyncio.wait_for(ws.close(code=SLOW_CONSUMER_CLOSE_CODE), self.send_timeout)
+        except Exception:
+            # The socket is already gone or stuck; either way it no longer receives broadcasts
+            pass
 
-manager = ConnectionManager()
+manager = ConnectionManager(
+    queue_size=settings.WS_CLIENT_QUEUE_SIZE,
+    send_timeout=settings.WS_SEND_TIMEOUT_SECONDS,
+    replay_buffer_size=settings.WS_REPLAY_BUFFER_SIZE,
+)
@@ -1,17 +1,50 @@
+import json
+from typing import Optional
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-import asyncio
+from pydantic import ValidationError
+from app.dto.alert_subscription import AlertSubscription
 from app.websocket.manager import manager
 import structlog
 
 logger = structlog.get_logger()
 router = APIRouter()
 
+# Policy violation: the subscription passed at connect was invalid
+INVALID_SUBSCRIPTION_CLOSE_CODE = 1008
+
 @router.websocket("/ws/alerts")
-async def alerts_ws(websocket: WebSocket):
-    await manager.connect(websocket)
-    logger.info(event="ws_connect", action="connect")
+async def alerts_ws(websocket: WebSocket, last_seq: Optional[int] = None, subscription: Optional[str] = None):
+    # Reconnecting clients pass the last seq they received to get only what they missed, and their
+    # subscription (as JSON) so that replay is filtered like the live feed
+    filters = None
+    if subscription is not None:
+        try:
+            filters = AlertSubscription.model_validate_json(subscription)
+        except ValidationError as validation_error:
+            await websocket.accept()
+            await websocket.send_text(json.dumps({"error": validation_error.errors(include_url=False)}, default=str))
+            await websocket.close(code=INVALID_SUBSCRIPTION_CLOSE_CODE)
+            return
+    await manager.connect(websocket, last_seq=last_seq, subscription=filters)
+    logger.info(
+        event="ws_connect",
+        action="connect",
+        last_seq=last_seq,
+        filters=filters.model_dump(mode="json", exclude_none=True) if filters is not None else None,
+    )
     try:
-        await asyncio.Event().wait()
+        # Each message replaces the client's subscription filters
+        while True:
+            raw = await websocket.receive_text()
+            try:
+                subscription = AlertSubscription.model_validate_json(raw)
+            except ValidationError as validation_error:
+                manager.send(websocket, json.dumps({"error": validation_error.errors(include_url=False)}, default=str))
+                continue
+            manager.subscribe(websocket, subscription)
+            manager.send(websocket, json.dumps({"subscribed": subscription.model_dump(mode="json")}))
+            logger.info("ws_subscribe", action="subscribe", filters=subscription.model_dump(mode="json", exclude_none=True))
     except WebSocketDisconnect:
+        logger.info("ws_disconnect", action="disconnect")
+    finally:
         manager.disconnect(websocket)
-        logger.info("ws_disconnect", event="disconnect")
@@ -0,0 +1,89 @@
+from itertools import chain
+from typing import AbstractSet, Any, Dict, Generic, Hashable, Mapping, Optional, Set, Tuple, TypeVar
+
+from app.dto.alert_subscription import AlertSubscription
+
+# Subscription field -> event attribute it filters on
+DIMENSIONS = {
+    "ticket_ids": "ticket_id",
+    "events": "event",
+    "priorities": "priority",
+    "customer_tiers": "customer_tier",
+}
+
+C = TypeVar("C", bound=Hashable)
+
+_EMPTY: AbstractSet[Any] = frozenset()
+
+def _within_threshold(subscription: AlertSubscription, event: Mapping[str, Any]) -> bool:
+    remaining_percent = event.get("remaining_percent")
+    if remaining_percent is None or subscription.max_remaining_percent is None:
+        return True
+    return remaining_percent <= subscription.max_remaining_percent
+
+class SubscriptionIndex(Generic[C]):
+    """Inverted index from filter values to subscribers, so routing an event only looks at likely matches.
+
+    A subscriber without a filter on some dimension sits in that dimension's wildcard set. Matching walks the
+    single dimension with the fewest candidates (the event's value bucket plus that dimension's wildcards) and
+    checks each candidate's other filters directly. That is cheap while most clients filter on something; when
+    most clients are unfiltered, every dimension's candidates are most clients, and so is the result.
+    """
+
+    def __init__(self):
+        self._by_value: Dict[str, Dict[Any, Set[C]]] = {attr: {} for attr in DIMENSIONS.values()}
+        self._wildcard: Dict[str, Set[C]] = {attr: set() for attr in DIMENSIONS.values()}
+        self._subscriptions: Dict[C, AlertSubscription] = {}
+
+    def subscribe(self, subscriber: C, subscription: AlertSubscription) -> None:
+        self.unsubscribe(subscriber)
+        self._subscriptions[subscriber] = subscription
+        for field, attr in DIMENSIONS.items():
+            values = getattr(subscription, field)
+            if values is None:
+                self._wildcard[attr].add(subscriber)
+                continue
+            for value in values:
+                self._by_value[attr].setdefault(value, set()).add(subscriber)
+
+    def unsubscribe(self, subscriber: C) -> None:
+        subscription = self._subscriptions.pop(subscriber, None)
+        if subscription is None:
+            return
+        for field, attr in DIMENSIONS.items():
+            values = getattr(subscription, field)
+            if values is None:
+                self._wildcard[attr].discard(subscriber)
+                continue
+            for value in values:
+                subscribers = self._by_value[attr].get(value)
+                if subscribers is not None:
+                    subscribers.discard(subscriber)
+                    if not subscribers:
+                        del self._by_value[attr][value]
+
+    def match(self, event: Mapping[str, Any]) -> Set[C]:
+        smallest: Optional[Tuple[AbstractSet[C], AbstractSet[C]]] = None
+        smallest_size = len(self._subscriptions) + 1
+        for attr in DIMENSIONS.values():
+            bucket = self._by_value[attr].get(event.get(attr), _EMPTY)
+            wildcard = self._wildcard[attr]
+            if len(bucket) + len(wildcard) < smallest_size:
+                smallest, smallest_size = (bucket, wildcard), len(bucket) + len(wildcard)
+        if smallest is None:
+            return set()
+        return {subscriber for subscriber in chain(*smallest) if self.accepts(subscriber, event)}
+
+    def accepts(self, subscriber: C, event: Mapping[str, Any]) -> bool:
+        """Whether one subscriber's filters match `event`, without going through the index."""
+        subscription = self._subscriptions.get(subscriber)
+        if subscription is None:
+            return False
+        for field, attr in DIMENSIONS.items():
+            values = getattr(subscription, field)
+            if values is not None and event.get(attr) not in values:
+                return False
+        return _within_threshold(subscription, event)
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
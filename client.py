@@ -1,17 +1,42 @@
 import asyncio
 import json
 import websockets
+from urllib.parse import urlencode
+
+RECONNECT_DELAY_SECONDS = 2
+
+# Filters for this dashboard, e.g. {"priorities": [2]} for HIGH only; sent on connect so replay is filtered too
+SUBSCRIPTION: dict = {}
 
 async def listen_alerts():
-    uri = "ws://localhost:8000/ws/alerts"
-    async with websockets.connect(uri) as websocket:
-        print("Connected to the alerts WebSocket. Awaiting messages...")
-        async for message in websocket:
-            data = json.loads(message)
-            event = data.get("event")
-            ticket_id = data.get("ticket_id")
-            remaining = data.get("remaining_percent")
-            print(f"[{event}] Ticket {ticket_id} — {remaining:.2f}% remaining")
+    last_seq = None
+    while True:
+        # Resume where the previous connection stopped instead of rescanning the dashboard
+        params = {}
+        if last_seq is not None:
+            params["last_seq"] = last_seq
+        if SUBSCRIPTION:
+            params["subscription"] = json.dumps(SUBSCRIPTION)
+        uri = "ws://localhost:8000/ws/alerts"
+        if params:
+            uri += f"?{urlencode(params)}"
+        try:
+            async with websockets.connect(uri) as websocket:
+                print("Connected to the alerts WebSocket. Awaiting messages...")
+                async for message in websocket:
+                    data = json.loads(message)
+                    event = data.get("event")
+                    if event == "RESYNC_NEEDED":
+                        print(f"Missed alerts after #{data.get('last_seq')} are no longer buffered, reload the dashboard")
+                        last_seq = None
+                        continue
+                    last_seq = data.get("seq", last_seq)
+                    ticket_id = data.get("ticket_id")
+                    remaining = data.get("remaining_percent")
+                    print(f"[{event}] Ticket {ticket_id} — {remaining:.2f}% remaining")
+        except (OSError, websockets.ConnectionClosed) as e:
+            print(f"Connection lost ({e}), reconnecting in {RECONNECT_DELAY_SECONDS}s...")
+        await asyncio.sleep(RECONNECT_DELAY_SECONDS)
 
 if __name__ == "__main__":
     try:
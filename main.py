@@ -2,6 +2,8 @@ from fastapi import FastAPI, Depends
 from app.config.config import lifespan
 from app.config.exception_handlers import register_exception_handlers
 from app.config.logging import setup_logging
+from app.controllers.admin_controller import router as admin_router
+from app.controllers.metrics_controller import router as metrics_router
 from app.controllers.ticket_controller import router as tickets_router
 from app.websocket.routes import router as websocket_router
 from app.dependencies import logging_dependency
@@ -19,4 +21,14 @@ app.include_router(
     dependencies=[Depends(logging_dependency)],
 )
 
+app.include_router(
+    metrics_router,
+    dependencies=[Depends(logging_dependency)],
+)
+
+app.include_router(
+    admin_router,
+    dependencies=[Depends(logging_dependency)],
+)
+
 app.include_router(websocket_router)
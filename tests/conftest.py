@@ -0,0 +1,14 @@
+import os
+
+# Settings are read at import time; the units under test never touch these services
+for _name, _value in {
+    "DATABASE_USER": "postgres",
+    "DATABASE_PASSWORD": "postgres",
+    "DATABASE_NAME": "test",
+    "DATABASE_HOST": "localhost",
+    "DATABASE_PORT": "5432",
+    "SCHEDULER_SECONDS_INTERVAL": "60",
+    "SLACK_WEBHOOK_URL": "http://localhost:8001",
+    "SLA_CONFIG_PATH": "sla_config.yaml",
+}.items():
+    os.environ.setdefault(_name, _value)
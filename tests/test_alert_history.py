@@ -0,0 +1,43 @@
+from app.websocket.history import AlertHistory, BufferedAlert
+
+def _alert(seq):
+    return BufferedAlert(seq, f"payload-{seq}", {"seq": seq})
+
+def _seqs(alerts):
+    return [alert.seq for alert in alerts]
+
+def test_since_returns_alerts_after_last_seq():
+    history = AlertHistory(capacity=10)
+    for seq in (1, 2, 3, 4):
+        history.append(_alert(seq))
+
+    assert _seqs(history.since(2)) == [3, 4]
+    assert history.since(4) == []
+
+def test_since_follows_arrival_order_not_seq_order():
+    history = AlertHistory(capacity=10)
+    for seq in (1, 3, 2, 4):
+        history.append(_alert(seq))
+
+    assert _seqs(history.since(3)) == [2, 4]
+
+def test_unknown_or_evicted_seq_needs_resync():
+    history = AlertHistory(capacity=3)
+    for seq in (1, 2, 3, 4, 5):
+        history.append(_alert(seq))
+
+    assert history.since(99) is None
+    assert history.since(2) is None
+    assert _seqs(history.since(3)) == [4, 5]
+    assert history.oldest_seq == 3
+    assert len(history) == 3
+
+def test_redelivered_seq_replays_from_latest_copy():
+    history = AlertHistory(capacity=3)
+    for seq in (1, 2, 1, 3):
+        history.append(_alert(seq))
+
+    assert _seqs(history.since(1)) == [3]
+    # Evicting the older copy of seq 1 must not forget the newer one
+    history.append(_alert(4))
+    assert _seqs(history.since(1)) == [3, 4]
@@ -0,0 +1,19 @@
+from datetime import datetime
+
+import pytest
+
+from app.exceptions.exceptions import UseCaseException
+from app.utils.cursor import decode_cursor, encode_cursor
+
+def test_round_trip():
+    deadline = datetime(2026, 3, 4, 5, 6, 7, 891011)
+
+    token = encode_cursor(deadline, 42)
+
+    assert "=" not in token
+    assert decode_cursor(token) == (deadline, 42)
+
+@pytest.mark.parametrize("token", ["", "not-a-cursor", "WyJ4Il0", "WzEsMiwzXQ"])
+def test_invalid_cursor_is_a_use_case_error(token):
+    with pytest.raises(UseCaseException, match="Invalid dashboard cursor"):
+        decode_cursor(token)
@@ -0,0 +1,135 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models.ticket import EscalationLevel
+from app.services import escalation_timer
+from app.services.escalation_timer import EscalationTimerQueue, RETRY_BASE_SECONDS, RETRY_MAX_SECONDS
+
+CREATED = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+@pytest.fixture
+def queue():
+    return EscalationTimerQueue(alert_remaining_percent=15.0)
+
+def test_instants_alert_at_remaining_percent(queue):
+    alert_at, breach_at = queue._instants(CREATED, CREATED + timedelta(minutes=100))
+    start = CREATED.timestamp()
+    assert alert_at == pytest.approx(start + 85 * 60 + escalation_timer.FIRE_GRACE_SECONDS)
+    assert breach_at == pytest.approx(start + 100 * 60 + escalation_timer.FIRE_GRACE_SECONDS)
+
+def test_alert_then_breach_rescheduled(queue):
+    queue._schedule(1, (100.0, 200.0), None)
+
+    assert queue._pop_due(150.0) == [1]
+    assert 1 in queue._deadlines
+    assert queue._pop_due(199.0) == []
+    assert queue._pop_due(200.0) == [1]
+    assert 1 not in queue._deadlines
+    assert queue._pop_due(1000.0) == []
+
+def test_stale_version_dropped(queue):
+    queue._schedule(1, (100.0, 200.0), None)
+    # Deadline moved out: the old heap entries stay until popped but must not fire
+    queue._schedule(1, (300.0, 400.0), None)
+
+    assert queue._pop_due(250.0) == []
+    assert queue._pop_due(300.0) == [1]
+    assert queue._pop_due(400.0) == [1]
+
+def test_unchanged_instants_keep_existing_timers(queue):
+    queue._schedule(1, (100.0, 200.0), None)
+    assert queue._pop_due(150.0) == [1]
+
+    queue._schedule(1, (100.0, 200.0), None)
+    # The alert already fired; only the breach is left
+    assert queue._pop_due(150.0) == []
+    assert queue._pop_due(200.0) == [1]
+
+def test_alert_level_schedules_only_breach(queue):
+    queue._schedule(1, (100.0, 200.0), EscalationLevel.ALERT)
+
+    assert queue._pop_due(150.0) == []
+    assert queue._pop_due(200.0) == [1]
+
+def test_breached_or_closed_tickets_untracked(queue):
+    queue._schedule(1, (100.0, 200.0), None)
+    queue._schedule(2, (100.0, 200.0), None)
+    queue._schedule(1, (100.0, 200.0), EscalationLevel.BREACH)
+    queue._schedule(2, None, None)
+
+    assert queue._deadlines == {}
+    assert queue._pop_due(1000.0) == []
+
+def test_retry_backoff_doubles_and_caps(queue, monkeypatch):
+    monkeypatch.setattr(escalation_timer.time, "time", lambda: 1000.0)
+
+    delays = []
+    for _ in range(10):
+        queue._retry_later([1])
+        delays.append(max(fire_at for fire_at, *_ in queue._heap) - 1000.0)
+
+    assert delays[:3] == [RETRY_BASE_SECONDS, 2 * RETRY_BASE_SECONDS, 4 * RETRY_BASE_SECONDS]
+    assert delays[-1] == RETRY_MAX_SECONDS
+    assert queue._retries[1][0] == 10
+
+def test_only_latest_retry_fires(queue, monkeypatch):
+    monkeypatch.setattr(escalation_timer.time, "time", lambda: 1000.0)
+    queue._retry_later([1])
+    queue._retry_later([1])
+
+    assert queue._pop_due(1001.0) == []
+    assert queue._pop_due(1002.0) == [1]
+
+def test_failed_escalation_retried_then_cleared(queue, monkeypatch):
+    monkeypatch.setattr(escalation_timer.time, "time", lambda: 1000.0)
+    calls = []
+
+    async def escalate(ticket_ids):
+        calls.append(list(ticket_ids))
+        if len(calls) == 1:
+            raise RuntimeError("database unavailable")
+
+    queue._escalate = escalate
+    asyncio.run(queue._fire([1, 2]))
+    assert set(queue._retries) == {1, 2}
+
+    due = queue._pop_due(1000.0 + RETRY_BASE_SECONDS)
+    assert due == [1, 2]
+    asyncio.run(queue._fire(due))
+    assert calls == [[1, 2], [1, 2]]
+    assert queue._retries == {}
+
+def test_due_ticket_reported_once_for_retry_and_instant(queue, monkeypatch):
+    monkeypatch.setattr(escalation_timer.time, "time", lambda: 100.0)
+    queue._schedule(1, (100.0 + RETRY_BASE_SECONDS, 500.0), None)
+    queue._retry_later([1])
+
+    assert queue._pop_due(100.0 + RETRY_BASE_SECONDS) == [1]
+
+def test_resync_keeps_tickets_tracked_during_load(queue):
+    deadline = CREATED + timedelta(hours=1)
+    moved = CREATED + timedelta(hours=5)
+    queue._schedule(1, queue._instants(CREATED, deadline), None)
+    queue._schedule(2, queue._instants(CREATED, deadline), None)
+    queue._schedule(3, queue._instants(CREATED, deadline), None)
+
+    async def load():
+        # Ingestion lands while the snapshot query runs: ticket 1's deadline moves and ticket 2 reopens
+        queue._apply([
+            (1, queue._instants(CREATED, moved), None),
+            (2, queue._instants(CREATED, deadline), None),
+        ])
+        # The snapshot predates that: old deadline for 1, 2 missing, 3 closed, 4 new
+        return [
+            (1, CREATED, deadline, None),
+            (4, CREATED, deadline, None),
+        ]
+
+    queue._load = load
+    asyncio.run(queue.resync())
+
+    assert set(queue._deadlines) == {1, 2, 4}
+    assert queue._deadlines[1][:2] == queue._instants(CREATED, moved)
+    assert queue._touched is None
@@ -0,0 +1,51 @@
+from typing import NamedTuple, Optional
+
+import pytest
+
+from app.models.ticket import EscalationLevel
+from app.services.sla_evaluator import evaluate_sla_batch
+
+class Row(NamedTuple):
+    created_epoch: float
+    deadline_epoch: float
+    escalation_level: Optional[EscalationLevel]
+
+NOW = 1000.0
+
+def test_remaining_percent_against_one_clock_reading():
+    rows = [Row(0.0, 2000.0, None), Row(500.0, 1500.0, None)]
+
+    evaluation = evaluate_sla_batch(rows, NOW, alert_remaining_percent=15.0)
+
+    assert evaluation.remaining_percent.tolist() == pytest.approx([50.0, 50.0])
+    assert evaluation.alert.tolist() == []
+    assert evaluation.breach.tolist() == []
+
+def test_alert_and_breach_indices():
+    rows = [
+        Row(0.0, 1100.0, None),                     # 9% left: alert
+        Row(0.0, 1100.0, EscalationLevel.ALERT),    # already alerted
+        Row(0.0, 1000.0, None),                     # deadline reached: breach, skipping the alert
+        Row(0.0, 900.0, EscalationLevel.ALERT),     # past deadline: breach
+        Row(0.0, 900.0, EscalationLevel.BREACH),    # already breached
+        Row(0.0, 5000.0, None),                     # plenty of time
+    ]
+
+    evaluation = evaluate_sla_batch(rows, NOW, alert_remaining_percent=15.0)
+
+    assert evaluation.alert.tolist() == [0]
+    assert evaluation.breach.tolist() == [2, 3]
+
+def test_empty_window_is_never_escalated():
+    rows = [Row(1000.0, 1000.0, None), Row(1000.0, 900.0, None)]
+
+    evaluation = evaluate_sla_batch(rows, NOW, alert_remaining_percent=15.0)
+
+    assert evaluation.alert.tolist() == []
+    assert evaluation.breach.tolist() == []
+
+def test_empty_batch():
+    evaluation = evaluate_sla_batch([], NOW, alert_remaining_percent=15.0)
+
+    assert len(evaluation.remaining_percent) == 0
+    assert evaluation.alert.tolist() == evaluation.breach.tolist() == []
@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.config.sla_config import DEFAULT_RESOLUTION_MINUTES, DEFAULT_RESPONSE_MINUTES, SLAMatrix
+from app.models.ticket import CustomerTier, Priority
+
+CONFIG = {
+    "DEFAULT": {"response_minutes": 60, "resolution_minutes": 240},
+    "SLA": {
+        "HIGH": {"PLATINUM": {"response_minutes": 10, "resolution_minutes": 30}},
+        "LOW": {"BRONZE": {"resolution_minutes": 180}},
+    },
+}
+
+def test_empty_config_uses_builtin_defaults():
+    matrix = SLAMatrix.compile({})
+
+    assert matrix.cell(Priority.HIGH, CustomerTier.GOLD) == (DEFAULT_RESPONSE_MINUTES, DEFAULT_RESOLUTION_MINUTES)
+    assert matrix.cell(Priority.LOW, None) == (DEFAULT_RESPONSE_MINUTES, DEFAULT_RESOLUTION_MINUTES)
+
+def test_cells_override_default_per_key():
+    matrix = SLAMatrix.compile(CONFIG)
+
+    assert matrix.cell(Priority.HIGH, CustomerTier.PLATINUM) == (10, 30)
+    assert matrix.cell(Priority.LOW, CustomerTier.BRONZE) == (60, 180)
+    assert matrix.cell(Priority.MEDIUM, None) == (60, 240)
+
+@pytest.mark.parametrize("config, message", [
+    ({"SLA": {"URGENT": {}}}, "Unknown Priority 'URGENT' in SLA config SLA"),
+    ({"SLA": {"HIGH": {"DIAMOND": {}}}}, "Unknown CustomerTier 'DIAMOND' in SLA config SLA.HIGH"),
+    ({"SLA": {"HIGH": {"GOLD": {"response_minutes": -1}}}}, "SLA.HIGH.GOLD.response_minutes"),
+    ({"DEFAULT": {"resolution_minutes": "4h"}}, "DEFAULT.resolution_minutes"),
+    ({"DEFAULT": {"resolution_minutes": True}}, "DEFAULT.resolution_minutes"),
+    ({"SLA": ["HIGH"]}, "SLA must be a mapping"),
+])
+def test_bad_config_raises_value_error_naming_the_key(config, message):
+    with pytest.raises(ValueError, match=message):
+        SLAMatrix.compile(config)
+
+def test_changed_cells():
+    before = SLAMatrix.compile(CONFIG)
+    after = SLAMatrix.compile({**CONFIG, "SLA": {**CONFIG["SLA"], "MEDIUM": {"GOLD": {"resolution_minutes": 90}}}})
+
+    assert before.changed_cells(before) == []
+    assert before.changed_cells(after) == [(Priority.MEDIUM, CustomerTier.GOLD)]
+
+def test_deadlines_for_a_batch_in_naive_utc():
+    matrix = SLAMatrix.compile(CONFIG)
+    created = datetime(2026, 1, 1, 12, 0)
+    created_aware = datetime(2026, 1, 1, 14, 0, tzinfo=timezone(timedelta(hours=2)))
+
+    response, resolution = matrix.deadlines(
+        [Priority.HIGH, Priority.MEDIUM],
+        [CustomerTier.PLATINUM, None],
+        [created, created_aware],
+    )
+
+    assert response == [created + timedelta(minutes=10), created + timedelta(minutes=60)]
+    assert resolution == [created + timedelta(minutes=30), created + timedelta(minutes=240)]
+    assert all(value.tzinfo is None for value in response + resolution)
@@ -0,0 +1,76 @@
+import random
+
+from app.dto.alert_subscription import AlertSubscription
+from app.models.ticket import CustomerTier, EscalationLevel, Priority
+from app.websocket.subscriptions import SubscriptionIndex
+
+def _event(**overrides):
+    event = {
+        "ticket_id": 1,
+        "event": EscalationLevel.ALERT,
+        "priority": Priority.HIGH,
+        "customer_tier": CustomerTier.GOLD,
+        "remaining_percent": 10.0,
+    }
+    event.update(overrides)
+    return event
+
+def test_unfiltered_subscriber_matches_everything():
+    index = SubscriptionIndex()
+    index.subscribe("all", AlertSubscription())
+
+    assert index.match(_event()) == {"all"}
+    assert index.match(_event(ticket_id=99, event=EscalationLevel.BREACH)) == {"all"}
+
+def test_filters_on_every_dimension():
+    index = SubscriptionIndex()
+    index.subscribe("ticket", AlertSubscription(ticket_ids=[1]))
+    index.subscribe("breaches", AlertSubscription(events=[EscalationLevel.BREACH]))
+    index.subscribe("high_gold", AlertSubscription(priorities=[Priority.HIGH], customer_tiers=[CustomerTier.GOLD]))
+    index.subscribe("urgent", AlertSubscription(max_remaining_percent=5.0))
+
+    assert index.match(_event()) == {"ticket", "high_gold"}
+    assert index.match(_event(ticket_id=2, event=EscalationLevel.BREACH, remaining_percent=-1.0)) == {
+        "breaches", "high_gold", "urgent",
+    }
+    assert index.match(_event(ticket_id=2, priority=Priority.LOW)) == set()
+
+def test_resubscribe_replaces_and_unsubscribe_removes():
+    index = SubscriptionIndex()
+    index.subscribe("client", AlertSubscription(ticket_ids=[1]))
+    index.subscribe("client", AlertSubscription(ticket_ids=[2]))
+
+    assert index.match(_event(ticket_id=1)) == set()
+    assert index.match(_event(ticket_id=2)) == {"client"}
+
+    index.unsubscribe("client")
+    assert index.match(_event(ticket_id=2)) == set()
+    assert len(index) == 0
+    assert not index.accepts("client", _event(ticket_id=2))
+
+def test_match_agrees_with_accepts():
+    rng = random.Random(7)
+    index = SubscriptionIndex()
+    for subscriber in range(500):
+        filters = {}
+        if rng.random() < 0.5:
+            filters["ticket_ids"] = rng.sample(range(20), 3)
+        if rng.random() < 0.5:
+            filters["priorities"] = [rng.choice(list(Priority))]
+        if rng.random() < 0.3:
+            filters["events"] = [rng.choice(list(EscalationLevel))]
+        if rng.random() < 0.3:
+            filters["customer_tiers"] = rng.sample(list(CustomerTier), 2)
+        if rng.random() < 0.3:
+            filters["max_remaining_percent"] = rng.uniform(0, 100)
+        index.subscribe(subscriber, AlertSubscription(**filters))
+
+    for _ in range(200):
+        event = _event(
+            ticket_id=rng.randrange(20),
+            event=rng.choice(list(EscalationLevel)),
+            priority=rng.choice(list(Priority)),
+            customer_tier=rng.choice(list(CustomerTier)),
+            remaining_percent=rng.uniform(-10, 100),
+        )
+        assert index.match(event) == {subscriber for subscriber in range(500) if index.accepts(subscriber, event)}